@@ -0,0 +1,178 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from app.company_store import find_company, serialize_document
+from app.keys import company_key
+
+
+class ByteLRUCache:
+    """A thread-safe TTL cache bounded by the total size of its values.
+
+    Entries expire `ttl` seconds after they were stored. When the sizes of
+    the stored values exceed `max_bytes`, the least recently used entries are
+    evicted first. Hit, miss and eviction counts are kept for metrics.
+
+    Args:
+        max_bytes (int): Upper bound on the summed size of all values.
+        ttl (float): Seconds an entry stays valid.
+        sizeof (callable): Returns the size of a value in bytes. Defaults to `len`.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float, sizeof=len):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._sizeof = sizeof
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key) -> bool:
+        return self.get(key, count=False) is not None
+
+    def _remove(self, key):
+        _, size, _ = self._data.pop(key)
+        self._bytes -= size
+
+    def get(self, key, count: bool = True):
+        """Returns the cached value for `key`, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[2] <= time.monotonic():
+                self._remove(key)
+                entry = None
+
+            if entry is None:
+                if count:
+                    self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            if count:
+                self.hits += 1
+            return entry[0]
+
+    def set(self, key, value):
+        """Stores `value` under `key`, evicting LRU entries to stay within `max_bytes`."""
+        size = self._sizeof(value)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (value, size, time.monotonic() + self.ttl)
+            self._bytes += size
+
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._data))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def pop(self, key):
+        """Removes `key` from the cache if present."""
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+
+    def clear(self):
+        """Removes every entry, keeping the counters."""
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        """Returns hit/miss/eviction counters and current occupancy."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+def json_size(value) -> int:
+    """Approximates the in-memory footprint of a JSON-ready value by its encoded size."""
+    return len(json.dumps(value, default=str).encode("utf-8"))
+
+
+class CompanyCache:
+    """Two-tier read-through cache for company documents.
+
+    L1 is an in-process `ByteLRUCache` keyed by canonical company key
+    (`company_key` of the stored company name). L2 is the Mongo companies
+    collection, queried by key or alias. Alias keys ("mtn", "MTN ") map to
+    the canonical key ("mtn group") in a separate small LRU, so every
+    spelling that ever resolved to a company shares one L1 entry.
+
+    Args:
+        collection: The pymongo companies collection (L2).
+        max_bytes (int): Size bound of the L1 tier.
+        ttl (float): Seconds an L1 entry stays valid.
+    """
+
+    def __init__(self, collection, max_bytes: int, ttl: float):
+        self.collection = collection
+        self.l1 = ByteLRUCache(max_bytes, ttl, sizeof=json_size)
+        self.aliases = ByteLRUCache(
+            max(1024, max_bytes // 64), ttl, sizeof=lambda key: len(key) + 64)
+        self.l2_hits = 0
+        self.l2_misses = 0
+
+    def _canonical(self, name: str) -> str:
+        key = company_key(name)
+        return self.aliases.get(key, count=False) or key
+
+    def get_local(self, name: str):
+        """Returns the L1 entry for any alias of `name`, without touching Mongo."""
+        return self.l1.get(self._canonical(name))
+
+    def put(self, document: dict, aliases: list = ()):
+        """Stores a JSON-ready document in L1 under its canonical key and aliases."""
+        key = company_key(document["company"])
+        self.l1.set(key, document)
+        for alias in aliases:
+            alias_key = company_key(alias)
+            if alias_key and alias_key != key:
+                self.aliases.set(alias_key, key)
+
+    def load(self, name: str):
+        """Reads through to Mongo (L2) on an L1 miss and fills L1 on a hit.
+
+        Blocking; call it off the event loop.
+
+        Returns:
+            dict or None: The JSON-ready company document.
+        """
+        document = self.l1.get(self._canonical(name), count=False)
+        if document is not None:
+            return document
+
+        document = find_company(self.collection, name)
+        if document is None:
+            self.l2_misses += 1
+            return None
+
+        self.l2_hits += 1
+        document = serialize_document(document)
+        self.put(document, [name])
+        return document
+
+    def invalidate(self, name: str):
+        """Drops the L1 entry for `name` (and whatever it aliases)."""
+        self.l1.pop(self._canonical(name))
+
+    def stats(self) -> dict:
+        """Returns L1 counters plus L2 hit/miss counts."""
+        stats = {f"l1_{k}": v for k, v in self.l1.stats().items()}
+        stats.update({"l2_hits": self.l2_hits, "l2_misses": self.l2_misses})
+        return stats
@@ -0,0 +1,239 @@
+from datetime import datetime, timezone
+import logging
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import OperationFailure
+from app.freshness import SECTION_FIELDS, section_ages
+from app.keys import company_key
+from app.metrics import timed
+
+
+logger = logging.getLogger(__name__)
+
+INTERNAL_FIELDS = ("_id", "company_key", "aliases")
+
+
+def serialize_document(document: dict) -> dict:
+    """Strips internal fields and ISO-formats timestamps so a document is JSON-ready."""
+    for key in INTERNAL_FIELDS:
+        document.pop(key, None)
+
+    for key in ['created_at', 'updated_at']:
+        if key in document and isinstance(document[key], datetime):
+            document[key] = document[key].isoformat()
+
+    return document
+
+
+def ensure_indexes(collection):
+    """Creates the indexes used by company lookups.
+
+    The unique index on `company_key` is partial, so lease documents (which
+    have no `company_key`) share the collection without conflicting. If
+    existing documents still hold duplicate keys it cannot be built; run the
+    backfill first. `aliases` gets a multikey index for alias lookups.
+
+    Args:
+        collection: The pymongo companies collection.
+    """
+    try:
+        collection.create_index(
+            "company_key",
+            unique=True,
+            partialFilterExpression={"company_key": {"$exists": True}},
+        )
+    except OperationFailure as e:
+        logger.warning(
+            "Could not create company_key index, run `python -m app.company_store`: %s", e)
+    collection.create_index("aliases")
+
+
+def find_company(collection, name: str):
+    """Looks a company up by its normalized key or any of its alias keys.
+
+    Both branches of the query are indexed equality matches.
+
+    Args:
+        collection: The pymongo companies collection.
+        name (str): The company name as entered by the user.
+
+    Returns:
+        dict or None: The stored company document.
+    """
+    key = company_key(name)
+    with timed("mongo_read"):
+        return collection.find_one({"$or": [{"company_key": key}, {"aliases": key}]})
+
+
+def save_company(collection, company_dict: dict, aliases: list = (), sections: list = None) -> dict:
+    """Upserts a scraped company document under its normalized key.
+
+    `created_at` is only set when the document is first inserted;
+    `updated_at` and the `sections_updated_at` entry of every refreshed
+    section are set on every save. The document's own key and the keys of
+    `aliases` (e.g. the name the user typed) are added to `aliases`.
+
+    Args:
+        collection: The pymongo companies collection.
+        company_dict (dict): The JSON-ready company data, including "company".
+        aliases (list): Other names that should resolve to this company.
+        sections (list): The sections (see `app.freshness.SECTION_FIELDS`) that
+            were scraped. Defaults to all of them.
+
+    Returns:
+        dict: The stored document (without `_id`).
+    """
+    now = datetime.now(timezone.utc).isoformat()
+    fields = {k: v for k, v in company_dict.items() if k not in (
+        "_id", "created_at", "aliases", "sections_updated_at")}
+    fields["company_key"] = company_key(company_dict["company"])
+    fields["updated_at"] = now
+    for section in (SECTION_FIELDS if sections is None else sections):
+        fields[f"sections_updated_at.{section}"] = now
+    alias_keys = {fields["company_key"]} | {
+        company_key(a) for a in aliases if a}
+
+    with timed("mongo_write"):
+        return collection.find_one_and_update(
+            {"company_key": fields["company_key"]},
+            {
+                "$set": fields,
+                "$setOnInsert": {"created_at": now},
+                "$addToSet": {"aliases": {"$each": sorted(alias_keys)}},
+            },
+            projection={"_id": 0},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+
+
+def touch_sections(collection, keys: list, sections: list) -> int:
+    """Marks sections of stored companies as fresh without changing their data.
+
+    Used when a cheap check shows the source has not changed since the last scrape.
+
+    Args:
+        collection: The pymongo companies collection.
+        keys (list): The `company_key` of every company to touch.
+        sections (list): The sections (see `app.freshness.SECTION_FIELDS`) to mark fresh.
+
+    Returns:
+        int: The number of documents updated.
+    """
+    if not keys:
+        return 0
+    now = datetime.now(timezone.utc).isoformat()
+    fields = {f"sections_updated_at.{section}": now for section in sections}
+    fields["updated_at"] = now
+    result = collection.update_many(
+        {"company_key": {"$in": list(keys)}}, {"$set": fields})
+    return result.modified_count
+
+
+def merge_duplicates(keeper: dict, duplicates: list) -> dict:
+    """Builds the update that folds duplicate documents into the one being kept.
+
+    The duplicates' aliases are added to the keeper's, and every section a
+    duplicate scraped more recently than the keeper (and that holds data)
+    replaces the keeper's, along with its `sections_updated_at` entry.
+
+    Args:
+        keeper (dict): The document that survives.
+        duplicates (list): The documents normalizing to the same key, to be removed.
+
+    Returns:
+        dict: A dictionary with keys:
+            - "set": dict (the `$set` fields for the keeper)
+            - "aliases": list (the alias keys to add to the keeper)
+            - "sections": list (the sections taken from a duplicate)
+    """
+    fields, aliases, sections = {}, set(), []
+    newest = dict(section_ages(keeper))
+
+    for duplicate in duplicates:
+        aliases.add(company_key(duplicate["company"]))
+        aliases.update(duplicate.get("aliases") or [])
+        ages = section_ages(duplicate)
+        for section, age in ages.items():
+            if age is None or (newest[section] is not None and age >= newest[section]):
+                continue
+            if not any(duplicate.get(field) for field in SECTION_FIELDS[section]):
+                continue
+            newest[section] = age
+            for field in SECTION_FIELDS[section]:
+                fields[field] = duplicate.get(field)
+            timestamp = (duplicate.get("sections_updated_at") or {}).get(section) \
+                or duplicate.get("updated_at")
+            fields[f"sections_updated_at.{section}"] = timestamp
+            if section not in sections:
+                sections.append(section)
+
+    return {"set": fields, "aliases": sorted(aliases), "sections": sections}
+
+
+def backfill_company_keys(collection, dry_run: bool = True) -> dict:
+    """One-off migration that adds `company_key` (and its alias) to existing company documents.
+
+    Documents are visited newest first; when several normalize to the same
+    key (duplicates left by concurrent inserts), the newest is kept and the
+    others are merged into it (see `merge_duplicates`) before being deleted.
+    By default nothing is written and the planned changes are only logged.
+
+    Args:
+        collection: The pymongo companies collection.
+        dry_run (bool): Whether to only log the changes instead of applying them.
+
+    Returns:
+        dict: Counts of documents "updated", "merged" into and "removed" as
+            duplicates, and whether it was a "dry_run".
+    """
+    groups = {}
+    cursor = collection.find({"company": {"$exists": True}}).sort("updated_at", -1)
+    for document in cursor:
+        groups.setdefault(company_key(document["company"]), []).append(document)
+
+    updates, removed, merged = [], [], 0
+    for key, (keeper, *duplicates) in groups.items():
+        update = {"$set": {"company_key": key}, "$addToSet": {"aliases": key}}
+        if duplicates:
+            merge = merge_duplicates(keeper, duplicates)
+            update["$set"].update(merge["set"])
+            update["$addToSet"] = {"aliases": {"$each": sorted({key, *merge["aliases"]})}}
+            removed.extend(duplicate["_id"] for duplicate in duplicates)
+            merged += 1
+            logger.info("Merging duplicates of %s", keeper["company"], extra={
+                "kept": str(keeper["_id"]),
+                "removed": [str(duplicate["_id"]) for duplicate in duplicates],
+                "sections": merge["sections"],
+                "dry_run": dry_run,
+            })
+        elif keeper.get("company_key") == key:
+            continue
+        updates.append(UpdateOne({"_id": keeper["_id"]}, update))
+
+    if not dry_run:
+        # The merged data is saved before any duplicate is deleted
+        if updates:
+            collection.bulk_write(updates, ordered=False)
+        if removed:
+            collection.delete_many({"_id": {"$in": removed}})
+
+    return {"updated": len(updates), "merged": merged,
+            "removed": len(removed), "dry_run": dry_run}
+
+
+if __name__ == "__main__":
+    import argparse
+    from app.db import companies
+    from app.log import configure_logging
+
+    parser = argparse.ArgumentParser(
+        description="Add company_key to stored companies and merge duplicates.")
+    parser.add_argument("--apply", action="store_true",
+                        help="Write the changes (by default they are only logged)")
+    args = parser.parse_args()
+
+    configure_logging(fmt="text")
+    summary = backfill_company_keys(companies, dry_run=not args.apply)
+    logger.info("Backfill %s", "applied" if args.apply else "planned (dry run)", extra=summary)
+    if args.apply:
+        ensure_indexes(companies)
@@ -0,0 +1,58 @@
+import os
+import threading
+from dotenv import load_dotenv
+
+
+_client = None
+_lock = threading.Lock()
+
+
+def get_client():
+    """Returns the process-wide MongoClient, creating it on first use.
+
+    Building the client (and resolving a `mongodb+srv` URI) is deferred until
+    a request actually needs the database, which keeps cold starts short.
+    """
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                from pymongo import MongoClient
+                load_dotenv()
+                _client = MongoClient(os.getenv("MONGO_URI"))
+    return _client
+
+
+def get_db():
+    """Returns the app database named by MONGO_DB."""
+    load_dotenv()
+    return get_client()[os.getenv("MONGO_DB")]
+
+
+class LazyCollection:
+    """A collection handle that only connects when it is first used.
+
+    Args:
+        env_var (str): Environment variable holding the collection name.
+        default (str): Collection name used when `env_var` is unset.
+    """
+
+    def __init__(self, env_var: str, default: str = None):
+        self.env_var = env_var
+        self.default = default
+        self._collection = None
+
+    def resolve(self):
+        """Returns the underlying pymongo collection."""
+        if self._collection is None:
+            load_dotenv()
+            self._collection = get_db()[os.getenv(self.env_var, self.default)]
+        return self._collection
+
+    def __getattr__(self, name):
+        return getattr(self.resolve(), name)
+
+
+companies = LazyCollection("MONGO_COLLECTION_ONE")
+countries = LazyCollection("MONGO_COLLECTION_TWO")
+jobs = LazyCollection("MONGO_COLLECTION_JOBS", "jobs")
@@ -0,0 +1,66 @@
+import os
+from datetime import datetime, timezone
+
+
+DAY = 24 * 3600
+
+# Fields of a company document refreshed together by one pipeline stage group
+SECTION_FIELDS = {
+    "wiki": ("company_info", "description", "wiki_page"),
+    "country": ("country",),
+    "stats": ("company_info_fixed", "competitors", "funding"),
+}
+
+# Seconds each section stays fresh before it is revalidated in the background
+FRESHNESS_POLICIES = {
+    "wiki": float(os.getenv("FRESHNESS_WIKI_DAYS", "30")) * DAY,
+    "country": float(os.getenv("FRESHNESS_COUNTRY_DAYS", "90")) * DAY,
+    "stats": float(os.getenv("FRESHNESS_STATS_DAYS", "7")) * DAY,
+}
+
+
+def parse_timestamp(value):
+    """Parses a stored ISO timestamp (or datetime) into an aware UTC datetime, or None."""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def section_ages(document: dict, now: datetime = None) -> dict:
+    """Returns the age in seconds of every section of a company document.
+
+    Sections use their own `sections_updated_at` timestamp when present and
+    fall back to the document's `updated_at`. Sections with no usable
+    timestamp get an age of None.
+    """
+    now = now or datetime.now(timezone.utc)
+    section_times = document.get("sections_updated_at") or {}
+    fallback = parse_timestamp(document.get("updated_at"))
+
+    ages = {}
+    for section in SECTION_FIELDS:
+        updated = parse_timestamp(section_times.get(section)) or fallback
+        ages[section] = (now - updated).total_seconds() if updated else None
+    return ages
+
+
+def stale_sections(document: dict, now: datetime = None) -> list:
+    """Returns the sections of a company document that are past their freshness policy."""
+    return [
+        section for section, age in section_ages(document, now).items()
+        if age is None or age > FRESHNESS_POLICIES[section]
+    ]
+
+
+def document_age(document: dict, now: datetime = None):
+    """Returns the age in whole seconds of the oldest section, or None if unknown."""
+    ages = [age for age in section_ages(document, now).values()
+            if age is not None]
+    return int(max(ages)) if ages else None
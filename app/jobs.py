@@ -0,0 +1,151 @@
+import socket
+import uuid
+from datetime import datetime, timedelta, timezone
+from pymongo import ASCENDING, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from app.keys import company_key
+
+
+STAGES = ("wiki", "country", "stats", "investors")
+
+
+class JobQueue:
+    """A durable scrape job queue stored in a Mongo collection.
+
+    Each job document tracks its status (queued, running, done or failed)
+    and the state of every pipeline stage. While a job is queued or running
+    it carries an `active_key` with a unique index, so a company has at most
+    one active job across all replicas. Running jobs hold a lease that the
+    worker renews; if a worker dies (or the instance restarts), the lease
+    expires and another worker claims the job again.
+
+    Args:
+        collection: The pymongo jobs collection.
+        lease_seconds (float): How long a claim lasts without a heartbeat.
+        max_attempts (int): Claims after which an unfinished job is failed.
+        failure_ttl (float): Seconds a failed job is returned for new requests
+            of the same company instead of enqueueing a new one.
+        retention (float): Seconds finished jobs are kept before Mongo purges them.
+    """
+
+    def __init__(self, collection, lease_seconds: float = 120, max_attempts: int = 3,
+                 failure_ttl: float = 600, retention: float = 86400):
+        self.collection = collection
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.failure_ttl = failure_ttl
+        self.retention = retention
+        self.owner = f"{socket.gethostname()}-{uuid.uuid4().hex[:8]}"
+
+    def ensure_indexes(self):
+        """Creates the active-job uniqueness, claim-order and retention indexes."""
+        self.collection.create_index(
+            "active_key", unique=True,
+            partialFilterExpression={"active_key": {"$exists": True}})
+        self.collection.create_index(
+            [("status", ASCENDING), ("created_at", ASCENDING)])
+        self.collection.create_index(
+            [("company_key", ASCENDING), ("finished_at", ASCENDING)])
+        self.collection.create_index(
+            "finished_at", expireAfterSeconds=int(self.retention))
+
+    def enqueue(self, company: str) -> dict:
+        """Queues a scrape for `company`, or returns the job already covering it.
+
+        Returns:
+            dict: The new job, the company's active job, or its recently failed job.
+        """
+        key = company_key(company)
+        now = datetime.now(timezone.utc)
+
+        failed = self.collection.find_one(
+            {"company_key": key, "status": "failed",
+             "finished_at": {"$gt": now - timedelta(seconds=self.failure_ttl)}},
+            sort=[("finished_at", -1)])
+        if failed:
+            return failed
+
+        job = {
+            "_id": uuid.uuid4().hex,
+            "company": company,
+            "company_key": key,
+            "active_key": key,
+            "status": "queued",
+            "stages": {stage: "pending" for stage in STAGES},
+            "attempts": 0,
+            "created_at": now,
+            "updated_at": now,
+        }
+        try:
+            self.collection.insert_one(job)
+            return job
+        except DuplicateKeyError:
+            existing = self.collection.find_one({"active_key": key})
+            return existing if existing else self.enqueue(company)
+
+    def claim(self):
+        """Claims the oldest queued job, or a running job whose lease expired.
+
+        Returns:
+            dict or None: The claimed job.
+        """
+        now = datetime.now(timezone.utc)
+        return self.collection.find_one_and_update(
+            {"$or": [
+                {"status": "queued"},
+                {"status": "running", "lease_expires_at": {"$lte": now}},
+            ]},
+            {
+                "$set": {
+                    "status": "running",
+                    "lease_owner": self.owner,
+                    "lease_expires_at": now + timedelta(seconds=self.lease_seconds),
+                    "updated_at": now,
+                },
+                "$inc": {"attempts": 1},
+            },
+            sort=[("created_at", ASCENDING)],
+            return_document=ReturnDocument.AFTER,
+        )
+
+    def _update(self, job_id: str, update: dict):
+        update.setdefault("$set", {})["updated_at"] = datetime.now(timezone.utc)
+        self.collection.update_one(
+            {"_id": job_id, "lease_owner": self.owner}, update)
+
+    def heartbeat(self, job_id: str):
+        """Extends the lease on a running job held by this worker."""
+        expires = datetime.now(timezone.utc) + \
+            timedelta(seconds=self.lease_seconds)
+        self._update(job_id, {"$set": {"lease_expires_at": expires}})
+
+    def set_stage(self, job_id: str, stage: str, state: str):
+        """Records the state ("running", "done" or "failed") of one pipeline stage."""
+        self._update(job_id, {"$set": {f"stages.{stage}": state}})
+
+    def complete(self, job_id: str, company: str):
+        """Marks a job done, pointing it at the stored company document."""
+        self._finish(job_id, {"status": "done", "result_company": company})
+
+    def fail(self, job_id: str, error: str):
+        """Marks a job failed with the given error message."""
+        self._finish(job_id, {"status": "failed", "error": error})
+
+    def requeue(self, job_id: str):
+        """Hands a claimed job back to the queue without counting the attempt."""
+        self._update(job_id, {
+            "$set": {"status": "queued"},
+            "$unset": {"lease_owner": "", "lease_expires_at": ""},
+            "$inc": {"attempts": -1},
+        })
+
+    def _finish(self, job_id: str, fields: dict):
+        fields["finished_at"] = datetime.now(timezone.utc)
+        self._update(job_id, {
+            "$set": fields,
+            "$unset": {"active_key": "", "lease_owner": "", "lease_expires_at": ""},
+        })
+
+    def get(self, job_id: str):
+        """Returns the job document for `job_id`, or None."""
+        return self.collection.find_one({"_id": job_id})
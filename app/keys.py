@@ -0,0 +1,26 @@
+import re
+import unicodedata
+
+
+def normalize_key(text: str) -> str:
+    """Normalizes free text into a cache/lookup key.
+
+    The key is accent-stripped, casefolded and whitespace-collapsed, so
+    "  Société Générale " and "societe generale" map to the same key.
+
+    Args:
+        text (str): The raw text.
+
+    Returns:
+        str: The normalized key, or an empty string for blank text.
+    """
+    if not text:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return re.sub(r"\s+", " ", stripped).strip().casefold()
+
+
+def company_key(name: str) -> str:
+    """Returns the key used to look up and coalesce work for a company name."""
+    return normalize_key(name)
@@ -0,0 +1,141 @@
+from logging.handlers import QueueHandler, QueueListener
+from datetime import datetime, timezone
+import logging
+import atexit
+import random
+import queue
+import copy
+import json
+import sys
+import os
+
+
+# Attributes every LogRecord has; anything else was passed through `extra=`
+_RECORD_FIELDS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+_listener = None
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps only a random `rate` share of DEBUG records; other levels always pass.
+
+    Dropped records are never formatted, so their arguments (e.g. a parsed
+    DOM subtree) are never converted to strings.
+    """
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > logging.DEBUG or random.random() < self.rate
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line, including `extra=` fields."""
+
+    def __init__(self, max_length: int = 2000):
+        super().__init__()
+        self.max_length = max_length
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        if len(message) > self.max_length:
+            message = message[:self.max_length] + "…"
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": message,
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_FIELDS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """Formats records as readable lines with `extra=` fields appended as key=value."""
+
+    def __init__(self, max_length: int = 2000):
+        super().__init__("%(asctime)s %(levelname)s %(name)s: %(message)s")
+        self.max_length = max_length
+
+    def format(self, record: logging.LogRecord) -> str:
+        record.message = record.getMessage()
+        record.asctime = self.formatTime(record)
+        line = self.formatMessage(record)
+        if len(line) > self.max_length:
+            line = line[:self.max_length] + "…"
+        extra = " ".join(f"{key}={value}" for key, value in vars(record).items()
+                         if key not in _RECORD_FIELDS)
+        if extra:
+            line = f"{line} {extra}"
+        if record.exc_info:
+            line = f"{line}\n{self.formatException(record.exc_info)}"
+        return line
+
+
+class DeferredQueueHandler(QueueHandler):
+    """A QueueHandler that leaves formatting to the listener thread.
+
+    The stock `prepare` formats the whole record in the calling thread and
+    clears `exc_info`, folding the traceback into the message. Here only the
+    message arguments are merged (so later changes to them do not show up in
+    the log) and `exc_info` is kept for the formatter.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def configure_logging(level: str = None, fmt: str = None, debug_sample_rate: float = None):
+    """Routes the `app` loggers through a non-blocking queue to stdout.
+
+    Log calls only merge the message arguments and enqueue the record; a
+    background listener thread formats it (tracebacks included) and writes
+    it, so request threads never block on stdout. Calling this again is a no-op.
+
+    Args:
+        level (str): Minimum level, default LOG_LEVEL or "INFO".
+        fmt (str): "json" or "text", default LOG_FORMAT or "json".
+        debug_sample_rate (float): Share of DEBUG records kept, default
+            LOG_DEBUG_SAMPLE_RATE or 0.01.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    level = (level or os.getenv("LOG_LEVEL", "INFO")).upper()
+    fmt = fmt or os.getenv("LOG_FORMAT", "json")
+    rate = float(os.getenv("LOG_DEBUG_SAMPLE_RATE", "0.01")
+                 ) if debug_sample_rate is None else debug_sample_rate
+
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(JsonFormatter() if fmt == "json" else TextFormatter())
+
+    records = queue.SimpleQueue()
+    handler = DeferredQueueHandler(records)
+    handler.addFilter(SamplingFilter(rate))
+
+    logger = logging.getLogger("app")
+    logger.setLevel(level)
+    logger.addHandler(handler)
+    logger.propagate = False
+
+    _listener = QueueListener(records, stream, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging():
+    """Flushes queued records and stops the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,165 @@
+import asyncio
+from datetime import datetime, timezone
+from numbers import Number
+import logging
+from fastapi.concurrency import run_in_threadpool
+from app.keys import normalize_key
+
+
+logger = logging.getLogger(__name__)
+
+
+class CountrySnapshot:
+    """An immutable, columnar snapshot of the countries collection.
+
+    Indicator values are held in a polars DataFrame (one row per country, one
+    Float64 column per indicator). Cross-country rankings (1 is the highest
+    value) and percentiles (share of countries with a value at or below the
+    country's) are computed once per snapshot, as are the response bodies, so
+    requests are plain dictionary lookups.
+
+    Args:
+        documents (list): Country documents with "name", "data" and optionally "updated_at".
+        descriptions (dict): Maps indicator names to their descriptions.
+    """
+
+    def __init__(self, documents: list, descriptions: dict = None):
+        import polars as pl
+
+        descriptions = descriptions or {}
+        documents = [d for d in documents if d.get("name")]
+        indicators = sorted({
+            indicator for document in documents
+            for indicator, value in (document.get("data") or {}).items()
+            if isinstance(value, Number) and not isinstance(value, bool)
+        })
+
+        def number(value):
+            return float(value) if isinstance(value, Number) and not isinstance(value, bool) else None
+
+        frame = pl.DataFrame(
+            {"name": [document["name"] for document in documents],
+             **{indicator: [number((document.get("data") or {}).get(indicator)) for document in documents]
+                for indicator in indicators}},
+            schema={"name": pl.Utf8, **{indicator: pl.Float64 for indicator in indicators}},
+        )
+        counts = {indicator: frame[indicator].count() for indicator in indicators}
+        self.frame = frame.with_columns(
+            [pl.col(i).rank("min", descending=True).alias(f"rank:{i}") for i in indicators] +
+            [(pl.col(i).rank("max") / max(counts[i], 1) * 100).round(1).alias(f"percentile:{i}")
+             for i in indicators]
+        )
+        self.indicators = indicators
+        self.loaded_at = datetime.now(timezone.utc)
+
+        updated = {document["name"]: document.get("updated_at") for document in documents}
+        self._countries = {}
+        listing = []
+
+        for row in self.frame.iter_rows(named=True):
+            name = row["name"]
+            updated_at = updated.get(name)
+            if isinstance(updated_at, datetime):
+                updated_at = updated_at.isoformat()
+
+            self._countries[normalize_key(name)] = {
+                "name": name,
+                "updated_at": updated_at,
+                "data": {
+                    indicator: {
+                        "value": row[indicator],
+                        "rank": row[f"rank:{indicator}"],
+                        "percentile": row[f"percentile:{indicator}"],
+                        "of": counts[indicator],
+                        "description": descriptions.get(indicator, ""),
+                    }
+                    for indicator in indicators if row[indicator] is not None
+                },
+            }
+            listing.append({
+                "name": name,
+                "data": {indicator: row[indicator] for indicator in indicators},
+            })
+
+        self._listing = {
+            "loaded_at": self.loaded_at.isoformat(),
+            "indicators": {indicator: descriptions.get(indicator, "") for indicator in indicators},
+            "rankings": {
+                indicator: self.frame.filter(pl.col(indicator).is_not_null())
+                .sort(indicator, descending=True)["name"].to_list()
+                for indicator in indicators
+            },
+            "countries": listing,
+        }
+
+    def __len__(self):
+        return self.frame.height
+
+    def listing(self) -> dict:
+        """Returns every country's indicator values and the per-indicator rankings."""
+        return self._listing
+
+    def country(self, name: str):
+        """Returns a country's indicators with their rank and percentile, or None."""
+        return self._countries.get(normalize_key(name))
+
+
+class MacroStore:
+    """Holds the current `CountrySnapshot` and rebuilds it on a schedule.
+
+    Nothing is loaded until the first `get`, which builds the snapshot and
+    starts the refresher, so instances that never serve country data never
+    import polars or read the countries collection. A refresh builds a
+    complete new snapshot off the event loop and then swaps the reference,
+    so readers always see one consistent snapshot.
+
+    Args:
+        collection: The pymongo countries collection.
+        descriptions (dict): Maps indicator names to their descriptions.
+        interval (float): Seconds between refreshes.
+    """
+
+    def __init__(self, collection, descriptions: dict = None, interval: float = 3600):
+        self.collection = collection
+        self.descriptions = descriptions or {}
+        self.interval = interval
+        self.snapshot = None
+        self._lock = asyncio.Lock()
+        self._task = None
+
+    def refresh(self) -> CountrySnapshot:
+        """Loads the countries collection into a new snapshot and publishes it."""
+        documents = list(self.collection.find({}, {"_id": 0}))
+        snapshot = CountrySnapshot(documents, self.descriptions)
+        self.snapshot = snapshot
+        return snapshot
+
+    async def get(self) -> CountrySnapshot:
+        """Returns the current snapshot, building it and starting the refresher on first use.
+
+        Raises:
+            Exception: If the first snapshot cannot be built.
+        """
+        if self.snapshot is None:
+            async with self._lock:
+                if self.snapshot is None:
+                    snapshot = await run_in_threadpool(self.refresh)
+                    logger.info("Loaded macro snapshot", extra={"countries": len(snapshot)})
+                    self._task = asyncio.create_task(self.run(delay=self.interval))
+        return self.snapshot
+
+    def stop(self):
+        """Stops the refresher, if it was started."""
+        if self._task is not None:
+            self._task.cancel()
+
+    async def run(self, delay: float = 0):
+        """Refreshes the snapshot after `delay` seconds and then every `interval` seconds."""
+        await asyncio.sleep(delay)
+        while True:
+            try:
+                snapshot = await run_in_threadpool(self.refresh)
+                logger.info("Loaded macro snapshot", extra={"countries": len(snapshot)})
+            except Exception as e:
+                logger.warning("Macro snapshot refresh failed: %s", e)
+            await asyncio.sleep(self.interval)
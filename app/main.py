@@ -1,20 +1,101 @@
 import os
+import sys
+import asyncio
+import logging
+import threading
 import uvicorn
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 from fastapi.middleware.cors import CORSMiddleware
-from datetime import datetime, timezone
 from fastapi.encoders import jsonable_encoder
-from pymongo import MongoClient
 from fastapi import FastAPI, HTTPException
-from cachetools import TTLCache
-from fastapi.responses import JSONResponse
-from app.scrapper_functions.scrapper import create_driver
-from app.scrapper_functions.data.data import african_countries, african_demonyms
-from app.scrapper_functions.functions.functions import get_wiki_link, find_country_of_origin, get_company_stats
+from fastapi.responses import JSONResponse, PlainTextResponse
+from starlette.concurrency import run_in_threadpool
+from app.keys import company_key
+from app.cache import ByteLRUCache, CompanyCache
+from app.freshness import SECTION_FIELDS, document_age, parse_timestamp, stale_sections
+from app.company_store import ensure_indexes, find_company, save_company, serialize_document
+from app.singleflight import SingleFlight, MongoLease
+from app.jobs import JobQueue
+from app.refresh import unchanged_wiki_pages
+from app.macro import MacroStore
+from app.metrics import registry, timed, cache_samples
+from app.scrapper_functions.data.data import indicator_descriptions
+from app.db import companies, countries, jobs
+from app.log import configure_logging
+# Scraping and macro modules (Selenium, Chrome, BeautifulSoup, polars, ...) are only
+# imported on first use, so cold starts that serve cached data never load them.
 # from app.scrapper_functions.functions.functions import get_macro_data, get_africamonitor_macro_data
 # from app.scrapper_functions.data.data import country_codes, macro_indicator_dict
 
-app = FastAPI()
+configure_logging()
+logger = logging.getLogger(__name__)
+
+
+def scrape_stack():
+    """Imports the scraping stack on first use.
+
+    Returns:
+        tuple: The shared `driver_pool` and `run_company_pipeline`.
+    """
+    from app.scrapper_functions.scrapper import driver_pool
+    from app.scrapper_functions.pipeline import run_company_pipeline
+    return driver_pool, run_company_pipeline
+
+
+def prepare_database():
+    """Creates the indexes the app relies on."""
+    ensure_indexes(companies)
+    job_queue.ensure_indexes()
+    if scrape_lease is not None:
+        scrape_lease.ensure_indexes()
+
+
+def warm_driver_pool(count: int):
+    """Imports the scraping stack and starts `count` Chrome drivers."""
+    driver_pool, _ = scrape_stack()
+    driver_pool.warm(count)
+
+
+def start_database_tasks():
+    """Starts index creation and the job workers, once per process.
+
+    Called by every request that needs MongoDB (and at startup with
+    EAGER_STARTUP=1), so cold starts that never reach the database neither
+    connect to it nor poll it. Must be called on the event loop.
+    """
+    global database_tasks_started
+    if database_tasks_started:
+        return
+    database_tasks_started = True
+
+    # Index creation runs in the background so the request is not blocked
+    task = asyncio.create_task(run_in_threadpool(prepare_database))
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    worker_tasks.extend(asyncio.create_task(job_worker())
+                        for _ in range(JOB_WORKERS))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if EAGER_STARTUP:
+        start_database_tasks()
+    warm_count = int(os.getenv("DRIVER_POOL_WARM", "1"))
+    if warm_count > 0:
+        threading.Thread(target=warm_driver_pool,
+                         args=(warm_count,), daemon=True).start()
+    yield
+    for worker in worker_tasks:
+        worker.cancel()
+    macro_store.stop()
+    scrape_executor.shutdown(wait=False, cancel_futures=True)
+    if "app.scrapper_functions.scrapper" in sys.modules:
+        scrape_stack()[0].close()
+
+
+app = FastAPI(lifespan=lifespan)
 
 origins = [
     "https://stears-lite.vercel.app",
@@ -31,12 +112,111 @@ app.add_middleware(
 
 load_dotenv()
 
-client = MongoClient(os.getenv("MONGO_URI"))
-db = client[os.getenv("MONGO_DB")]
-companies = db[os.getenv("MONGO_COLLECTION_ONE")]
-countries = db[os.getenv("MONGO_COLLECTION_TWO")]
 
-cache = TTLCache(maxsize=100, ttl=3600*5)
+# L1 (in-process, bounded by bytes) over L2 (Mongo), shared by every alias of a company
+cache = CompanyCache(
+    companies,
+    max_bytes=int(os.getenv("COMPANY_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+    ttl=float(os.getenv("COMPANY_CACHE_TTL", str(3600 * 5))),
+)
+
+# Blocking scrapes run on their own bounded executor so they never stall the loop
+SCRAPE_CONCURRENCY = int(
+    os.getenv("SCRAPE_CONCURRENCY", os.getenv("DRIVER_POOL_SIZE", "2")))
+SCRAPE_QUEUE_LIMIT = int(os.getenv("SCRAPE_QUEUE_LIMIT", "16"))
+scrape_executor = ThreadPoolExecutor(
+    max_workers=SCRAPE_CONCURRENCY, thread_name_prefix="scrape")
+pending_scrapes = 0
+
+# Concurrent lookups of one company share a single scrape, in-process and across replicas
+SCRAPE_LEASE_SECONDS = float(os.getenv("SCRAPE_LEASE_SECONDS", "180"))
+SCRAPE_LEASE_POLL_SECONDS = float(os.getenv("SCRAPE_LEASE_POLL_SECONDS", "1"))
+scrape_flight = SingleFlight()
+scrape_lease = MongoLease(
+    companies, ttl=SCRAPE_LEASE_SECONDS) if SCRAPE_LEASE_SECONDS > 0 else None
+
+
+# Stale documents are served immediately and refreshed in the background, at most
+# once per company per cooldown
+REFRESH_COOLDOWN_SECONDS = float(os.getenv("REFRESH_COOLDOWN_SECONDS", "900"))
+refresh_attempts = ByteLRUCache(
+    max_bytes=1024 * 1024, ttl=REFRESH_COOLDOWN_SECONDS, sizeof=lambda _: 64)
+background_tasks = set()
+
+
+# Cache misses become durable scrape jobs, picked up by workers on any replica
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", str(SCRAPE_CONCURRENCY)))
+JOB_POLL_SECONDS = float(os.getenv("JOB_POLL_SECONDS", "1"))
+job_queue = JobQueue(
+    jobs,
+    lease_seconds=float(os.getenv("JOB_LEASE_SECONDS", "120")),
+    max_attempts=int(os.getenv("JOB_MAX_ATTEMPTS", "3")),
+    failure_ttl=float(os.getenv("JOB_FAILURE_TTL", "600")),
+)
+worker_tasks = []
+
+# Indexes and job workers start with the first request that needs MongoDB,
+# or at startup with EAGER_STARTUP=1
+EAGER_STARTUP = os.getenv("EAGER_STARTUP", "0") == "1"
+database_tasks_started = False
+
+
+# Country macro data is served from an in-memory snapshot of the countries collection,
+# built by the first /countries request
+macro_store = MacroStore(
+    countries, indicator_descriptions,
+    interval=float(os.getenv("MACRO_REFRESH_SECONDS", "3600")))
+
+
+@registry.collector
+def runtime_samples() -> list:
+    """Reads cache, driver pool, NER and scrape queue stats for `/metrics`.
+
+    Scraping modules that were never imported (e.g. on a cold start that only
+    served cached data) are skipped rather than imported here.
+    """
+    samples = cache_samples("company_l1", cache.l1.stats())
+    samples += cache_samples("company_aliases", cache.aliases.stats())
+    samples += [
+        ("cache_hits_total", {"cache": "company_l2"}, cache.l2_hits),
+        ("cache_misses_total", {"cache": "company_l2"}, cache.l2_misses),
+        ("scrape_pending", {}, pending_scrapes),
+        ("scrape_background_tasks", {}, len(background_tasks)),
+    ]
+
+    search = sys.modules.get("app.scrapper_functions.search")
+    if search is not None:
+        samples += cache_samples("search", search.search_cache.stats())
+
+    scrapper = sys.modules.get("app.scrapper_functions.scrapper")
+    if scrapper is not None:
+        pool = scrapper.driver_pool.metrics()
+        samples.append(("driver_launches_total", {}, pool.pop("created")))
+        for key, value in pool.items():
+            name = f"driver_pool_{key}"
+            if key not in ("size", "live", "idle", "in_use"):
+                name += "_total"
+            samples.append((name, {}, value))
+
+    ner = sys.modules.get("app.scrapper_functions.ner")
+    if ner is not None:
+        stats = ner.ner_metrics()
+        samples += [
+            ("ner_loaded", {}, stats["loaded"]),
+            ("ner_load_seconds", {}, stats["load_seconds"]),
+            ("ner_calls_total", {}, stats["calls"]),
+            ("ner_call_seconds_total", {}, stats["call_seconds_total"]),
+            ("ner_call_seconds_max", {}, stats["call_seconds_max"]),
+        ]
+        samples += cache_samples("ner", {
+            "hits": stats["cache_hits"], "misses": stats["cache_misses"],
+            "entries": stats["cache_size"]})
+
+    return samples
+
+
+class ScrapeQueueFull(Exception):
+    """Raised when SCRAPE_QUEUE_LIMIT scrapes are already in flight or queued."""
 
 
 @app.get("/")
@@ -44,99 +224,385 @@ async def root():
     return {"message": "Welcome to the FastAPI-powered backend for Stears Lite, an economic data insights platform. Docs: /docs"}
 
 
+def scrape_company(company: str, progress=None) -> dict:
+    """Runs the blocking scrape pipeline for a company and stores the result.
+
+    Meant to be run on `scrape_executor`, never directly on the event loop.
+
+    Args:
+        company (str): The (stripped) company name requested by the client.
+        progress (callable): Optional `progress(stage, state)` callback (see `run_company_pipeline`).
+
+    Returns:
+        dict: The JSON-ready company document that was inserted into Mongo.
+
+    Raises:
+        HTTPException: If the country cannot be detected or the scrape fails.
+    """
+    logger.info("Fetching fresh data", extra={"company": company})
+    driver_pool, run_company_pipeline = scrape_stack()
+    data = {}
+
+    try:
+        with timed("pipeline"):
+            result = run_company_pipeline(
+                company, driver_pool, progress=progress)
+        errors = result.pop("errors")
+
+        if "wiki" in errors:
+            logger.warning("Wikipedia stage failed: %s", errors["wiki"],
+                           extra={"company": company})
+            # raise HTTPException(status_code=500, detail={
+            #                     "Wiki Error": str(errors["wiki"])})
+
+        if "country" in errors:
+            raise HTTPException(status_code=500, detail={
+                                "Country Detection Error": str(errors["country"])})
+
+        if not result["country"]:
+            raise HTTPException(status_code=404, detail={
+                                "Country Match Error": f"Could not find country of origin for '{company}' among African countries."})
+
+        if "stats" in errors:
+            raise HTTPException(status_code=400, detail={
+                                "Error": str(errors["stats"])})
+
+        data = result
+
+    except Exception as e:
+        raise HTTPException(status_code=400, detail={"error": str(e)})
+
+    company_dict = save_company(
+        companies, jsonable_encoder(data), aliases=[company])
+
+    return serialize_document(company_dict)
+
+
+def refresh_company(document: dict, sections: list, check_revision: bool = True):
+    """Re-scrapes the stale sections of a stored company and saves them.
+
+    Meant to be run on `scrape_executor`. Sections whose stage fails or comes
+    back empty keep their stored values (and their old timestamps). If the
+    stored Wikipedia revision is still current, the Wikipedia section is only
+    marked fresh instead of being fetched and parsed again.
+
+    Args:
+        document (dict): The JSON-ready stored company document.
+        sections (list): The stale sections (see `app.freshness.SECTION_FIELDS`).
+        check_revision (bool): Whether to check the Wikipedia revision first.
+
+    Returns:
+        dict or None: The updated JSON-ready document, or None if nothing was refreshed.
+    """
+    logger.info("Refreshing stale sections", extra={
+                "company": document["company"], "sections": list(sections)})
+    updated, refreshed = dict(document), []
+
+    if "wiki" in sections and check_revision:
+        try:
+            if unchanged_wiki_pages([document]):
+                sections = [s for s in sections if s != "wiki"]
+                refreshed.append("wiki")
+        except Exception as e:
+            logger.warning("Wikipedia revision check failed: %s", e,
+                           extra={"company": document["company"]})
+
+    result, errors = {}, {}
+    if sections:
+        stages = tuple(sections) + \
+            (("investors",) if "stats" in sections else ())
+        driver_pool, run_company_pipeline = scrape_stack()
+        with timed("pipeline_refresh"):
+            result = run_company_pipeline(
+                document["company"], driver_pool, stages=stages)
+        errors = result.pop("errors")
+
+    for section in sections:
+        if section in errors:
+            logger.warning("Refresh of %s failed: %s", section, errors[section],
+                           extra={"company": document["company"]})
+            continue
+        fields = SECTION_FIELDS[section]
+        if not any(result[field] for field in fields):
+            continue
+        for field in fields:
+            updated[field] = result[field]
+        refreshed.append(section)
+
+    if not refreshed:
+        return None
+
+    company_dict = save_company(
+        companies, jsonable_encoder(updated), sections=refreshed)
+
+    return serialize_document(company_dict)
+
+
+async def run_scrape(fn, *args) -> dict:
+    """Runs a blocking scrape function on the bounded scrape executor."""
+    global pending_scrapes
+
+    if pending_scrapes >= SCRAPE_QUEUE_LIMIT:
+        raise ScrapeQueueFull(
+            "Too many scrapes in progress, please retry shortly.")
+
+    pending_scrapes += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(scrape_executor, fn, *args)
+    finally:
+        pending_scrapes -= 1
+
+
+async def fetch_fresh(company: str, key: str, progress=None) -> dict:
+    """Scrapes a company once across replicas, or waits for the replica that is.
+
+    With the Mongo lease enabled, only the instance holding the lease for
+    `key` scrapes; the others poll the lease until the holder records the
+    stored company name (or error) and then read the stored document.
+
+    Args:
+        company (str): The (stripped) company name requested by the client.
+        key (str): The normalized company key.
+        progress (callable): Optional stage progress callback for the scrape.
+
+    Returns:
+        dict: The JSON-ready company document.
+    """
+    if scrape_lease is None:
+        return await run_scrape(scrape_company, company, progress)
+
+    while not await run_in_threadpool(scrape_lease.acquire, key):
+        await asyncio.sleep(SCRAPE_LEASE_POLL_SECONDS)
+        lease = await run_in_threadpool(scrape_lease.status, key)
+        if lease and lease.get("result_error"):
+            raise Exception(lease["result_error"])
+        if lease and lease.get("result_company"):
+            existing = await run_in_threadpool(
+                find_company, companies, lease["result_company"])
+            if existing:
+                return serialize_document(existing)
+
+    try:
+        # Another replica may have finished between our cache miss and the lease
+        existing = await run_in_threadpool(find_company, companies, company)
+        company_dict = serialize_document(
+            existing) if existing else await run_scrape(scrape_company, company, progress)
+    except ScrapeQueueFull:
+        await run_in_threadpool(scrape_lease.release, key)
+        raise
+    except Exception as e:
+        await run_in_threadpool(scrape_lease.release, key, None, str(e))
+        raise
+
+    await run_in_threadpool(scrape_lease.release, key, company_dict["company"])
+    return company_dict
+
+
+async def run_job(job: dict):
+    """Runs one claimed scrape job, renewing its lease until the scrape finishes."""
+    job_id, company = job["_id"], job["company"]
+    key = company_key(company)
+
+    if job["attempts"] > job_queue.max_attempts:
+        await run_in_threadpool(job_queue.fail, job_id, "Scrape abandoned after too many attempts.")
+        return
+
+    def progress(stage: str, state: str):
+        job_queue.set_stage(job_id, stage, state)
+
+    scrape = asyncio.ensure_future(scrape_flight.do(
+        key, lambda: fetch_fresh(company, key, progress)))
+    while True:
+        done, _ = await asyncio.wait({scrape}, timeout=job_queue.lease_seconds / 3)
+        if done:
+            break
+        await run_in_threadpool(job_queue.heartbeat, job_id)
+
+    try:
+        company_dict = scrape.result()
+    except ScrapeQueueFull:
+        await run_in_threadpool(job_queue.requeue, job_id)
+        await asyncio.sleep(JOB_POLL_SECONDS)
+        return
+    except Exception as e:
+        await run_in_threadpool(job_queue.fail, job_id, str(e))
+        return
+
+    cache.put(company_dict, [company])
+    await run_in_threadpool(job_queue.complete, job_id, company_dict["company"])
+
+
+async def job_worker():
+    """Claims and runs scrape jobs from the durable queue until cancelled."""
+    while True:
+        try:
+            job = await run_in_threadpool(job_queue.claim)
+            if job is None:
+                await asyncio.sleep(JOB_POLL_SECONDS)
+                continue
+            await run_job(job)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.exception("Job worker error: %s", e)
+            await asyncio.sleep(JOB_POLL_SECONDS)
+
+
+def job_status(job: dict) -> dict:
+    """Builds the public view of a job document."""
+    status = {
+        "job_id": job["_id"],
+        "company": job["company"],
+        "status": job["status"],
+        "stages": job.get("stages", {}),
+        "status_url": f"/jobs/{job['_id']}",
+    }
+    for key in ["created_at", "updated_at", "finished_at"]:
+        timestamp = parse_timestamp(job.get(key))
+        if timestamp:
+            status[key] = timestamp.isoformat()
+    if job.get("error"):
+        status["error"] = job["error"]
+    return status
+
+
+async def revalidate(document: dict, sections: list):
+    """Refreshes stale sections in the background, once across replicas."""
+    lease_key = f"refresh:{company_key(document['company'])}"
+    if scrape_lease is not None and not await run_in_threadpool(scrape_lease.acquire, lease_key):
+        return
+
+    try:
+        refreshed = await run_scrape(refresh_company, document, sections)
+        if refreshed:
+            cache.put(refreshed)
+    except Exception as e:
+        logger.warning("Background refresh failed: %s", e,
+                       extra={"company": document["company"]})
+    finally:
+        if scrape_lease is not None:
+            await run_in_threadpool(scrape_lease.release, lease_key)
+
+
+def company_response(document: dict) -> JSONResponse:
+    """Serves a stored company, scheduling a background refresh if any section is stale.
+
+    The `Age` header carries the age in seconds of the oldest section and
+    `X-Stale-Sections` lists the sections being revalidated.
+    """
+    headers = {}
+    age = document_age(document)
+    if age is not None:
+        headers["Age"] = str(age)
+
+    stale = stale_sections(document)
+    if stale:
+        headers["X-Stale-Sections"] = ",".join(stale)
+        key = company_key(document["company"])
+        if refresh_attempts.get(key, count=False) is None:
+            refresh_attempts.set(key, True)
+            task = asyncio.create_task(revalidate(document, stale))
+            background_tasks.add(task)
+            task.add_done_callback(background_tasks.discard)
+
+    return JSONResponse(content=document, status_code=200, headers=headers)
+
+
 @app.get("/information/{company}")
-async def get_information(company: str):
+async def get_information(company: str, wait: bool = False):
+    """Returns a company's data, or `202` with a scrape job on a cache miss.
+
+    Pass `wait=true` to block until the scrape finishes instead.
+    """
     if not company.strip():
         return JSONResponse(content={"error": "Company name cannot be empty."}, status_code=400)
 
-    if company.strip() in cache:
-        print("Returning cached data for", company.strip())
-        return JSONResponse(content=cache[company.strip()], status_code=200)
+    start_database_tasks()
+
+    cached = cache.get_local(company)
+    if cached is not None:
+        logger.debug("Returning cached data", extra={"company": company.strip()})
+        return company_response(cached)
 
     try:
-        # Check if company exists in the database
-        existing = companies.find_one(
-            {"company": {"$regex": f"^{company.strip()}$", "$options": "i"}})
+        # Read through to the database (off the loop, outside the scrape executor)
+        existing = await run_in_threadpool(cache.load, company)
 
         if existing:
-            print("Returning data from database for", company.strip())
+            logger.debug("Returning data from database",
+                         extra={"company": company.strip()})
 
-            existing.pop("_id", None)
+            return company_response(existing)
 
-            for key in ['created_at', 'updated_at']:
-                if key in existing and isinstance(existing[key], datetime):
-                    existing[key] = existing[key].isoformat()
+        if not wait:
+            job = await run_in_threadpool(job_queue.enqueue, company.strip())
+            status = job_status(job)
+            if job["status"] == "failed":
+                return JSONResponse(content=status, status_code=500)
+            return JSONResponse(content=status, status_code=202, headers={"Location": status["status_url"]})
 
-            cache[company.strip()] = existing
+        key = company_key(company)
+        company_dict = await scrape_flight.do(
+            key, lambda: fetch_fresh(company.strip(), key))
 
-            return JSONResponse(content=existing, status_code=200)
+        cache.put(company_dict, [company])
 
-        print("Fetching fresh data for", company.strip())
-        driver = create_driver()
-        data = {}
+        return company_response(company_dict)
 
-        try:
-            try:
-                company_name, company_info, desc = get_wiki_link(
-                    company.strip(), driver)
-            except Exception as e:
-                print(str(e))
-                company_name, company_info, desc = None, None, None
-                # raise HTTPException(status_code=500, detail={
-                #                     "Wiki Error": str(e)})
-
-            try:
-                country = find_country_of_origin(
-                    company_name if company_name else company.strip(),
-                    african_countries,
-                    company_info if company_info else {},
-                    african_demonyms,
-                    driver
-                )
-            except Exception as e:
-                raise HTTPException(status_code=500, detail={
-                                    "Country Detection Error": str(e)})
-
-            if not country:
-                raise HTTPException(status_code=404, detail={
-                                    "Country Match Error": f"Could not find country of origin for '{company.strip()}' among African countries."})
-
-            try:
-                name_for_stats = company_name if company_name else company.strip()
-                competitors, funding, company_information_dict = get_company_stats(
-                    name_for_stats, driver)
-            except Exception as e:
-                raise HTTPException(status_code=400, detail={"Error": str(e)})
-
-            data = {
-                "company": name_for_stats,
-                "company_info_fixed": company_information_dict,
-                "company_info": company_info if company_info else {},
-                "description": desc if desc else "",
-                "country": country,
-                "competitors": competitors,
-                "funding": funding,
-            }
+    except ScrapeQueueFull as e:
+        return JSONResponse(content={"error": str(e)}, status_code=503, headers={"Retry-After": "10"})
+    except Exception as e:
+        return JSONResponse(content={"error": str(e)}, status_code=500)
 
-        except Exception as e:
-            raise HTTPException(status_code=400, detail={"error": str(e)})
-        finally:
-            driver.quit()
 
-        company_dict = jsonable_encoder(data)
-        now = datetime.now(timezone.utc).isoformat()
-        company_dict["created_at"] = now
-        company_dict["updated_at"] = now
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Reports a scrape job's progress through the stages, and its result once done."""
+    start_database_tasks()
+    job = await run_in_threadpool(job_queue.get, job_id)
+    if job is None:
+        return JSONResponse(content={"error": "Job not found."}, status_code=404)
 
-        companies.insert_one(company_dict)
-        company_dict.pop("_id", None)
+    status = job_status(job)
+    if job["status"] == "done":
+        status["result"] = await run_in_threadpool(cache.load, job["result_company"])
 
-        cache[company] = company_dict
+    return JSONResponse(content=status, status_code=200)
 
-        return JSONResponse(content=company_dict, status_code=200)
 
+@app.get("/metrics")
+async def metrics():
+    """Exposes stage latency histograms and runtime counters in the Prometheus text format."""
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+
+@app.get("/countries")
+async def get_countries():
+    """Lists every country's macro indicators with cross-country rankings."""
+    try:
+        snapshot = await macro_store.get()
     except Exception as e:
-        return JSONResponse(content={"error": str(e)}, status_code=500)
+        logger.warning("Macro snapshot load failed: %s", e)
+        return JSONResponse(content={"error": "Country data is unavailable."}, status_code=503, headers={"Retry-After": "5"})
+
+    return JSONResponse(content=snapshot.listing(), status_code=200)
+
+
+@app.get("/countries/{name}")
+async def get_country(name: str):
+    """Returns a country's macro indicators with its rank and percentile for each."""
+    try:
+        snapshot = await macro_store.get()
+    except Exception as e:
+        logger.warning("Macro snapshot load failed: %s", e)
+        return JSONResponse(content={"error": "Country data is unavailable."}, status_code=503, headers={"Retry-After": "5"})
+
+    country = snapshot.country(name)
+    if country is None:
+        return JSONResponse(content={"error": f"No macro data for '{name}'."}, status_code=404)
+
+    return JSONResponse(content=country, status_code=200)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,215 @@
+from bisect import bisect_left
+from contextlib import contextmanager
+import threading
+import logging
+import time
+
+
+logger = logging.getLogger(__name__)
+
+# Latency buckets in seconds, from cache lookups up to slow browser page loads
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1, 2.5, 5, 10, 20, 30, 60, 120)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: tuple, values: tuple, extra: dict = None) -> str:
+    pairs = list(zip(names, values)) + list((extra or {}).items())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _number(value) -> str:
+    if isinstance(value, bool):
+        return str(int(value))
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """A monotonically increasing count, optionally split by labels.
+
+    Args:
+        name (str): The metric name; should end in `_total`.
+        help (str): One-line description.
+        labelnames (tuple): Label names passed to `inc` as keyword arguments.
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: tuple = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels):
+        """Adds `amount` to the series identified by `labels`."""
+        key = tuple(labels.get(name, "") for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self) -> list:
+        """Returns the exposition lines of every series."""
+        with self._lock:
+            return [f"{self.name}{_labels(self.labelnames, key)} {_number(value)}"
+                    for key, value in sorted(self._values.items())]
+
+
+class Histogram:
+    """A distribution of observed values (e.g. latencies) in cumulative buckets.
+
+    Args:
+        name (str): The metric name, e.g. `scrape_stage_seconds`.
+        help (str): One-line description.
+        labelnames (tuple): Label names passed to `observe` as keyword arguments.
+        buckets (tuple): Increasing upper bounds; `+Inf` is added.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: tuple = (), buckets: tuple = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        """Records one observation in the series identified by `labels`."""
+        key = tuple(labels.get(name, "") for name in self.labelnames)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * len(self.buckets), 0, 0.0]
+            series[0][index] += 1
+            series[1] += 1
+            series[2] += value
+
+    @contextmanager
+    def time(self, **labels):
+        """Observes the wall-clock duration of the `with` block, even if it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def samples(self) -> list:
+        """Returns the exposition lines of every series."""
+        lines = []
+        with self._lock:
+            for key, (counts, count, total) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, bucket in zip(self.buckets, counts):
+                    cumulative += bucket
+                    lines.append(f"{self.name}_bucket"
+                                 f"{_labels(self.labelnames, key, {'le': _number(bound)})} {cumulative}")
+                labels = _labels(self.labelnames, key)
+                lines.append(f"{self.name}_sum{labels} {_number(total)}")
+                lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class Registry:
+    """Collects metrics and renders them in the Prometheus text format.
+
+    Besides `Counter` and `Histogram` instances, callables can be registered
+    as collectors. They are called at scrape time and return `(name, labels,
+    value)` tuples read from existing stats (cache counters, the driver pool,
+    ...); names ending in `_total` are exposed as counters, the rest as gauges.
+    """
+
+    def __init__(self):
+        self._metrics = []
+        self._collectors = []
+
+    def register(self, metric):
+        """Adds a metric and returns it."""
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: tuple = ()) -> Counter:
+        """Creates and registers a `Counter`."""
+        return self.register(Counter(name, help, labelnames))
+
+    def histogram(self, name: str, help: str, labelnames: tuple = (), buckets: tuple = DEFAULT_BUCKETS) -> Histogram:
+        """Creates and registers a `Histogram`."""
+        return self.register(Histogram(name, help, labelnames, buckets))
+
+    def collector(self, fn):
+        """Registers a collector callable; usable as a decorator."""
+        self._collectors.append(fn)
+        return fn
+
+    def render(self) -> str:
+        """Returns every metric in the Prometheus text exposition format."""
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+
+        # Samples of one metric must be contiguous, whichever collector they came from
+        grouped = {}
+        for collect in self._collectors:
+            try:
+                samples = list(collect())
+            except Exception as e:
+                logger.warning("Metrics collector failed: %s", e)
+                continue
+            for name, labels, value in samples:
+                if value is not None:
+                    grouped.setdefault(name, []).append((labels or {}, value))
+
+        for name, samples in grouped.items():
+            kind = "counter" if name.endswith("_total") else "gauge"
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                lines.append(
+                    f"{name}{_labels(tuple(labels), tuple(labels.values()))} {_number(value)}")
+
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+# Latency of every pipeline stage and of the calls inside them
+stage_seconds = registry.histogram(
+    "scrape_stage_seconds",
+    "Duration of scrape pipeline stages and the fetches inside them.",
+    labelnames=("stage",))
+
+stage_failures = registry.counter(
+    "scrape_stage_failures_total",
+    "Pipeline stages and fetches that raised.",
+    labelnames=("stage",))
+
+
+@contextmanager
+def timed(stage: str):
+    """Times the `with` block as `stage` and counts it as failed if it raises."""
+    try:
+        with stage_seconds.time(stage=stage):
+            yield
+    except BaseException:
+        stage_failures.inc(stage=stage)
+        raise
+
+
+def cache_samples(cache: str, stats: dict) -> list:
+    """Converts `ByteLRUCache.stats()` into collector samples labelled with `cache`."""
+    labels = {"cache": cache}
+    return [
+        (f"cache_{key}_total" if key in ("hits", "misses", "evictions") else f"cache_{key}",
+         labels, value)
+        for key, value in stats.items()
+    ]
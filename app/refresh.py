@@ -0,0 +1,96 @@
+import argparse
+import logging
+from app.company_store import find_company, serialize_document, touch_sections
+from app.freshness import stale_sections
+from app.keys import company_key
+
+
+logger = logging.getLogger(__name__)
+
+
+def unchanged_wiki_pages(documents: list) -> set:
+    """Checks which stored companies still match the current Wikipedia revision.
+
+    All revisions are looked up together, 50 articles per API call.
+    Documents without a stored page id or revision are treated as changed.
+
+    Args:
+        documents (list): Stored company documents.
+
+    Returns:
+        set: The `company_key` of every document whose article has not changed.
+    """
+    from app.scrapper_functions.wikipedia import latest_revisions
+
+    pages = {}
+    for document in documents:
+        page = document.get("wiki_page") or {}
+        if page.get("pageid") and page.get("revid"):
+            pages[company_key(document["company"])] = page
+    if not pages:
+        return set()
+
+    revisions = latest_revisions([page["pageid"] for page in pages.values()])
+    return {key for key, page in pages.items()
+            if revisions.get(page["pageid"]) == page["revid"]}
+
+
+def revalidate_wiki_sections(collection, limit: int = 1000) -> dict:
+    """Batch-revalidates the stale Wikipedia sections of stored companies.
+
+    Companies whose article has not changed are marked fresh in one update;
+    the others are returned so they can be re-scraped.
+
+    Args:
+        collection: The pymongo companies collection.
+        limit (int): Maximum number of companies to check.
+
+    Returns:
+        dict: A dictionary with keys:
+            - "checked": int (companies with a stale Wikipedia section)
+            - "unchanged": int (companies marked fresh)
+            - "changed": list of company names whose article moved (or was never tracked)
+    """
+    cursor = collection.find(
+        {"company_key": {"$exists": True}},
+        {"company": 1, "wiki_page": 1, "sections_updated_at": 1, "updated_at": 1},
+    ).limit(limit)
+    stale = [document for document in cursor
+             if "wiki" in stale_sections(document)]
+
+    unchanged = unchanged_wiki_pages(stale)
+    touch_sections(collection, list(unchanged), ["wiki"])
+
+    return {
+        "checked": len(stale),
+        "unchanged": len(unchanged),
+        "changed": [document["company"] for document in stale
+                    if company_key(document["company"]) not in unchanged],
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Revalidate stale Wikipedia sections of stored companies.")
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--scrape", action="store_true",
+                        help="Re-scrape the companies whose article changed")
+    args = parser.parse_args()
+
+    from app.db import companies
+    from app.log import configure_logging
+
+    configure_logging(fmt="text")
+    summary = revalidate_wiki_sections(companies, args.limit)
+    print(summary)
+
+    if args.scrape:
+        from app.main import refresh_company
+
+        for name in summary["changed"]:
+            document = serialize_document(find_company(companies, name))
+            try:
+                refresh_company(document, ["wiki"], check_revision=False)
+            except Exception as e:
+                logger.warning("Refresh failed: %s", e,
+                               extra={"company": name})
@@ -0,0 +1,36 @@
+from contextlib import contextmanager
+import threading
+
+
+_local = threading.local()
+
+
+class StageCancelled(Exception):
+    """Raised inside a pipeline stage whose result is no longer needed."""
+
+
+@contextmanager
+def cancel_scope(event: threading.Event):
+    """Makes `event` the cancel flag checked by `check_cancelled` in this thread."""
+    previous = getattr(_local, "event", None)
+    _local.event = event
+    try:
+        yield
+    finally:
+        _local.event = previous
+
+
+def cancelled() -> bool:
+    """Whether the current thread's stage has been cancelled."""
+    event = getattr(_local, "event", None)
+    return event is not None and event.is_set()
+
+
+def check_cancelled():
+    """Raises `StageCancelled` if the current thread's stage has been cancelled.
+
+    Fetch and search helpers call this before every request, so an abandoned
+    stage stops at its next request instead of running to the end.
+    """
+    if cancelled():
+        raise StageCancelled("Stage cancelled")
@@ -0,0 +1,136 @@
+import re
+from app.scrapper_functions.data.data import (
+    african_countries, african_demonyms, african_country_aliases, african_demonym_aliases)
+
+
+# A demonym mention is weaker evidence than naming the country itself
+COUNTRY_WEIGHT = 1.0
+DEMONYM_WEIGHT = 0.5
+
+
+def trie_pattern(words) -> str:
+    """Builds a regex alternation for `words` shaped as a character trie.
+
+    Shared prefixes are factored out ("niger", "nigeria", "nigerian" become
+    `niger(?:ia(?:n)?|ien)?`), so the regex engine walks each position of the
+    text once instead of retrying every word from scratch.
+
+    Args:
+        words (iterable): The literal strings to match.
+
+    Returns:
+        str: A regex (without anchors) matching any of `words`.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node) -> str:
+        ends_here = "" in node
+        branches = [re.escape(char) + build(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if ends_here:
+            return "(?:" + body + ")?"
+        return body
+
+    return build(trie)
+
+
+class CountryMatcher:
+    """Counts mentions of countries, their aliases and demonyms in one pass.
+
+    The matcher is compiled once from the country list, demonym map and
+    aliases. Matching lowercases the text and runs a single trie-shaped
+    regex over it, so the cost is linear in the text regardless of how many
+    countries are known. Longer names win over names they contain
+    ("Guinea-Bissau" over "Guinea", "Nigerian" over "Niger"), and a
+    trailing plural "s" is accepted ("Kenyans").
+
+    Args:
+        countries (list): Country names to report.
+        demonyms (dict): Mapping of country name to demonym.
+        country_aliases (dict): Alternative country spellings mapped to a name in `countries`.
+        demonym_aliases (dict): Alternative demonyms mapped to a name in `countries`.
+    """
+
+    def __init__(self, countries: list, demonyms: dict = None,
+                 country_aliases: dict = None, demonym_aliases: dict = None):
+        self.countries = list(countries)
+        known = set(self.countries)
+        self.surfaces = {}
+
+        # Demonyms first, so a demonym that equals a country name counts as the country
+        for country, demonym in (demonyms or {}).items():
+            if country in known and demonym:
+                self.surfaces[demonym.lower()] = (country, DEMONYM_WEIGHT)
+        for demonym, country in (demonym_aliases or {}).items():
+            if country in known:
+                self.surfaces[demonym.lower()] = (country, DEMONYM_WEIGHT)
+        for alias, country in (country_aliases or {}).items():
+            if country in known:
+                self.surfaces[alias.lower()] = (country, COUNTRY_WEIGHT)
+        for country in self.countries:
+            self.surfaces[country.lower()] = (country, COUNTRY_WEIGHT)
+
+        self.pattern = re.compile(
+            r"\b(" + trie_pattern(self.surfaces) + r")s?\b")
+
+    def scores(self, text: str, demonyms: bool = True) -> dict:
+        """Returns the weighted mention score of every country found in `text`.
+
+        Args:
+            text (str): The text to scan.
+            demonyms (bool): Whether demonym mentions count.
+
+        Returns:
+            dict: Country name to score, in order of first mention.
+        """
+        scores = {}
+        if not text:
+            return scores
+
+        surfaces = self.surfaces
+        for match in self.pattern.finditer(text.lower()):
+            country, weight = surfaces[match.group(1)]
+            if weight == DEMONYM_WEIGHT and not demonyms:
+                continue
+            scores[country] = scores.get(country, 0) + weight
+        return scores
+
+    def rank(self, text: str, demonyms: bool = True) -> list:
+        """Returns `(country, score)` candidates found in `text`, best first.
+
+        Ties keep the order in which the countries were first mentioned.
+        """
+        return sorted(self.scores(text, demonyms).items(),
+                      key=lambda item: item[1], reverse=True)
+
+    def best(self, text: str, demonyms: bool = True) -> str:
+        """Returns the highest-scoring country in `text`, or an empty string."""
+        ranked = self.rank(text, demonyms)
+        return ranked[0][0] if ranked else ""
+
+
+country_matcher = CountryMatcher(
+    african_countries, african_demonyms, african_country_aliases, african_demonym_aliases)
+
+_matchers = {}
+
+
+def get_matcher(countries: list, demonyms: dict = None) -> CountryMatcher:
+    """Returns the shared matcher for the bundled data, or a cached one for custom lists."""
+    if countries is african_countries and demonyms in (None, african_demonyms):
+        return country_matcher
+
+    key = (tuple(countries), tuple(sorted((demonyms or {}).items())))
+    matcher = _matchers.get(key)
+    if matcher is None:
+        matcher = _matchers[key] = CountryMatcher(
+            countries, demonyms, african_country_aliases, african_demonym_aliases)
+    return matcher
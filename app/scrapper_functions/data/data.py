@@ -215,3 +215,44 @@ country_codes = {
                  'Madagascar': 'MDG',
                  'Morocco': 'MAR'
 }
+
+# Alternative spellings that should count as a mention of a country in `african_countries`
+african_country_aliases = {
+    "Côte d'Ivoire": "Ivory Coast",
+    "Côte d’Ivoire": "Ivory Coast",
+    "Cote d'Ivoire": "Ivory Coast",
+    "Cote d’Ivoire": "Ivory Coast",
+    "Cote dIvoire": "Ivory Coast",
+    "DRC": "DR Congo",
+    "DR of Congo": "DR Congo",
+    "Democratic Republic of the Congo": "DR Congo",
+    "Democratic Republic of Congo": "DR Congo",
+    "Congo-Kinshasa": "DR Congo",
+    "Congo Kinshasa": "DR Congo",
+    "Congo-Brazzaville": "Republic of the Congo",
+    "Congo Brazzaville": "Republic of the Congo",
+    "Republic of Congo": "Republic of the Congo",
+    "Congo Republic": "Republic of the Congo",
+    "Swaziland": "Eswatini",
+    "Cabo Verde": "Cape Verde",
+    "Sao Tome and Principe": "São Tomé and Príncipe",
+    "São Tomé & Príncipe": "São Tomé and Príncipe",
+    "Sao Tome & Principe": "São Tomé and Príncipe",
+    "Reunion": "Réunion",
+    "Guinea Bissau": "Guinea-Bissau",
+    "Sahrawi Arab Democratic Republic": "Western Sahara",
+    "Saint Helena": "Saint Helena, Ascension and Tristan da Cunha",
+}
+
+# Alternative demonyms that should count as a mention of a country in `african_countries`
+african_demonym_aliases = {
+    "Batswana": "Botswana",
+    "Basotho": "Lesotho",
+    "Swazi": "Eswatini",
+    "Burkinabe": "Burkina Faso",
+    "Sao Tomean": "São Tomé and Príncipe",
+    "Cabo Verdean": "Cape Verde",
+    "Reunionese": "Réunion",
+    "Equatorial Guinean": "Equatorial Guinea",
+    "Somalian": "Somalia",
+}
@@ -0,0 +1,175 @@
+# African cities, states and regions mapped to the country names used in `african_countries`.
+# Names that are common outside Africa (e.g. "Victoria", "Georgetown", "Cairo" in Illinois,
+# "Alexandria" in Virginia) are left out on purpose; the NER resolves them when the country is
+# named next to them, and the DuckDuckGo search otherwise.
+african_places = {
+    # Algeria
+    "Algiers": "Algeria", "Oran": "Algeria", "Annaba": "Algeria",
+    "Blida": "Algeria", "Batna": "Algeria", "Sétif": "Algeria", "Tlemcen": "Algeria",
+    "Béjaïa": "Algeria", "Hassi Messaoud": "Algeria", "Ouargla": "Algeria",
+    # Angola
+    "Luanda": "Angola", "Huambo": "Angola", "Lobito": "Angola", "Benguela": "Angola",
+    "Lubango": "Angola", "Cabinda": "Angola", "Talatona": "Angola",
+    # Benin
+    "Cotonou": "Benin", "Porto-Novo": "Benin", "Parakou": "Benin", "Abomey-Calavi": "Benin",
+    # Botswana
+    "Gaborone": "Botswana", "Francistown": "Botswana", "Maun": "Botswana", "Molepolole": "Botswana",
+    # Burkina Faso
+    "Ouagadougou": "Burkina Faso", "Bobo-Dioulasso": "Burkina Faso", "Koudougou": "Burkina Faso",
+    # Burundi
+    "Bujumbura": "Burundi", "Gitega": "Burundi",
+    # Cameroon
+    "Yaoundé": "Cameroon", "Douala": "Cameroon", "Bamenda": "Cameroon", "Bafoussam": "Cameroon",
+    "Garoua": "Cameroon", "Buea": "Cameroon",
+    # Cape Verde
+    "Mindelo": "Cape Verde",
+    # Central African Republic
+    "Bangui": "Central African Republic",
+    # Chad
+    "N'Djamena": "Chad", "Ndjamena": "Chad", "Moundou": "Chad",
+    # Comoros
+    "Moroni, Comoros": "Comoros",
+    # DR Congo
+    "Kinshasa": "DR Congo", "Lubumbashi": "DR Congo", "Goma": "DR Congo", "Kisangani": "DR Congo",
+    "Mbuji-Mayi": "DR Congo", "Kananga": "DR Congo", "Bukavu": "DR Congo", "Kolwezi": "DR Congo",
+    "Matadi": "DR Congo", "Katanga": "DR Congo",
+    # Republic of the Congo
+    "Brazzaville": "Republic of the Congo", "Pointe-Noire": "Republic of the Congo",
+    # Djibouti
+    "Djibouti City": "Djibouti",
+    # Egypt
+    "New Cairo": "Egypt", "Giza": "Egypt", "Sheikh Zayed City": "Egypt",
+    "6th of October City": "Egypt", "Smart Village": "Egypt",
+    "Heliopolis": "Egypt", "Maadi": "Egypt", "Zamalek": "Egypt", "Nasr City": "Egypt",
+    "Port Said": "Egypt", "Suez": "Egypt", "Luxor": "Egypt", "Aswan": "Egypt", "Mansoura": "Egypt",
+    "Tanta": "Egypt", "Asyut": "Egypt", "Ismailia": "Egypt", "Hurghada": "Egypt",
+    "Sharm El Sheikh": "Egypt", "New Administrative Capital": "Egypt",
+    # Equatorial Guinea
+    "Malabo": "Equatorial Guinea",
+    # Eritrea
+    "Asmara": "Eritrea", "Massawa": "Eritrea",
+    # Eswatini
+    "Mbabane": "Eswatini", "Manzini": "Eswatini", "Lobamba": "Eswatini",
+    # Ethiopia
+    "Addis Ababa": "Ethiopia", "Dire Dawa": "Ethiopia", "Mekelle": "Ethiopia", "Gondar": "Ethiopia",
+    "Bahir Dar": "Ethiopia", "Hawassa": "Ethiopia", "Adama": "Ethiopia", "Jimma": "Ethiopia",
+    "Oromia": "Ethiopia", "Tigray": "Ethiopia", "Amhara Region": "Ethiopia",
+    # Gabon
+    "Libreville": "Gabon", "Port-Gentil": "Gabon", "Franceville": "Gabon",
+    # Gambia
+    "Banjul": "Gambia", "Serekunda": "Gambia", "Brikama": "Gambia",
+    # Ghana
+    "Accra": "Ghana", "Kumasi": "Ghana", "Tamale": "Ghana", "Takoradi": "Ghana",
+    "Sekondi-Takoradi": "Ghana", "Tema": "Ghana", "Cape Coast": "Ghana", "Koforidua": "Ghana",
+    "East Legon": "Ghana", "Greater Accra": "Ghana",
+    "Ashanti Region": "Ghana",
+    # Guinea
+    "Conakry": "Guinea", "Kankan": "Guinea", "Nzérékoré": "Guinea",
+    # Guinea-Bissau
+    "Bissau": "Guinea-Bissau",
+    # Ivory Coast
+    "Abidjan": "Ivory Coast", "Yamoussoukro": "Ivory Coast", "Bouaké": "Ivory Coast",
+    "San-Pédro": "Ivory Coast", "Plateau, Abidjan": "Ivory Coast", "Cocody": "Ivory Coast",
+    # Kenya
+    "Nairobi": "Kenya", "Mombasa": "Kenya", "Kisumu": "Kenya", "Nakuru": "Kenya",
+    "Eldoret": "Kenya", "Thika": "Kenya", "Machakos": "Kenya", "Nyeri": "Kenya",
+    "Upper Hill": "Kenya", "Kilimani": "Kenya", "Karen, Nairobi": "Kenya",
+    "Gigiri": "Kenya", "Kiambu": "Kenya", "Kajiado": "Kenya", "Konza": "Kenya",
+    # Lesotho
+    "Maseru": "Lesotho",
+    # Liberia
+    "Monrovia": "Liberia", "Gbarnga": "Liberia",
+    # Libya
+    "Benghazi": "Libya", "Misrata": "Libya", "Sabha": "Libya",
+    # Madagascar
+    "Antananarivo": "Madagascar", "Toamasina": "Madagascar", "Antsirabe": "Madagascar",
+    "Mahajanga": "Madagascar", "Fianarantsoa": "Madagascar",
+    # Malawi
+    "Lilongwe": "Malawi", "Blantyre": "Malawi", "Mzuzu": "Malawi", "Zomba": "Malawi",
+    # Mali
+    "Bamako": "Mali", "Sikasso": "Mali", "Timbuktu": "Mali", "Ségou": "Mali",
+    # Mauritania
+    "Nouakchott": "Mauritania", "Nouadhibou": "Mauritania",
+    # Mauritius
+    "Port Louis": "Mauritius", "Ebene": "Mauritius", "Ebène": "Mauritius", "Cybercity": "Mauritius",
+    "Quatre Bornes": "Mauritius", "Curepipe": "Mauritius", "Vacoas": "Mauritius",
+    # Mayotte
+    "Mamoudzou": "Mayotte",
+    # Morocco
+    "Rabat": "Morocco", "Casablanca": "Morocco", "Marrakesh": "Morocco", "Marrakech": "Morocco",
+    "Fez": "Morocco", "Fès": "Morocco", "Tangier": "Morocco", "Tanger": "Morocco", "Agadir": "Morocco",
+    "Meknes": "Morocco", "Oujda": "Morocco", "Kenitra": "Morocco", "Tétouan": "Morocco",
+    "Casablanca Finance City": "Morocco",
+    # Mozambique
+    "Maputo": "Mozambique", "Beira": "Mozambique", "Nampula": "Mozambique", "Matola": "Mozambique",
+    "Pemba, Mozambique": "Mozambique",
+    # Namibia
+    "Windhoek": "Namibia", "Walvis Bay": "Namibia", "Swakopmund": "Namibia", "Oshakati": "Namibia",
+    # Niger
+    "Niamey": "Niger", "Zinder": "Niger", "Maradi": "Niger", "Agadez": "Niger",
+    # Nigeria
+    "Lagos": "Nigeria", "Abuja": "Nigeria", "Kano": "Nigeria", "Ibadan": "Nigeria",
+    "Port Harcourt": "Nigeria", "Benin City": "Nigeria", "Kaduna": "Nigeria", "Enugu": "Nigeria",
+    "Onitsha": "Nigeria", "Aba": "Nigeria", "Jos": "Nigeria", "Ilorin": "Nigeria",
+    "Abeokuta": "Nigeria", "Owerri": "Nigeria", "Uyo": "Nigeria", "Calabar": "Nigeria",
+    "Warri": "Nigeria", "Akure": "Nigeria", "Maiduguri": "Nigeria", "Sokoto": "Nigeria",
+    "Ikeja": "Nigeria", "Lekki": "Nigeria", "Ikoyi": "Nigeria",
+    "Yaba": "Nigeria", "Surulere": "Nigeria", "Apapa": "Nigeria", "Marina, Lagos": "Nigeria",
+    "Maitama": "Nigeria", "Wuse": "Nigeria", "Garki": "Nigeria",
+    "Lagos State": "Nigeria", "Ogun State": "Nigeria", "Rivers State": "Nigeria",
+    "Oyo State": "Nigeria", "Kano State": "Nigeria", "Anambra State": "Nigeria",
+    "Edo State": "Nigeria", "Enugu State": "Nigeria",
+    "Kaduna State": "Nigeria", "Federal Capital Territory": "Nigeria",
+    # Réunion
+    "Saint-Denis, Réunion": "Réunion", "Saint-Pierre, Réunion": "Réunion",
+    # Rwanda
+    "Kigali": "Rwanda", "Butare": "Rwanda", "Huye": "Rwanda", "Musanze": "Rwanda", "Rubavu": "Rwanda",
+    # São Tomé and Príncipe
+    "São Tomé": "São Tomé and Príncipe", "Sao Tome": "São Tomé and Príncipe",
+    # Senegal
+    "Dakar": "Senegal", "Thiès": "Senegal", "Saint-Louis, Senegal": "Senegal", "Touba": "Senegal",
+    "Diamniadio": "Senegal", "Ziguinchor": "Senegal",
+    # Seychelles
+    "Mahe, Seychelles": "Seychelles", "Praslin": "Seychelles",
+    # Sierra Leone
+    "Freetown": "Sierra Leone", "Bo, Sierra Leone": "Sierra Leone", "Kenema": "Sierra Leone",
+    # Somalia
+    "Mogadishu": "Somalia", "Hargeisa": "Somalia", "Kismayo": "Somalia", "Bosaso": "Somalia",
+    "Garowe": "Somalia", "Berbera": "Somalia",
+    # South Africa
+    "Johannesburg": "South Africa", "Cape Town": "South Africa", "Durban": "South Africa",
+    "Pretoria": "South Africa", "Tshwane": "South Africa", "Port Elizabeth": "South Africa",
+    "Gqeberha": "South Africa", "Bloemfontein": "South Africa", "Polokwane": "South Africa",
+    "Nelspruit": "South Africa", "Mbombela": "South Africa",
+    "Pietermaritzburg": "South Africa", "Stellenbosch": "South Africa",
+    "Sandton": "South Africa", "Midrand": "South Africa",
+    "Soweto": "South Africa", "Umhlanga": "South Africa",
+    "Rustenburg": "South Africa", "Gauteng": "South Africa", "Western Cape": "South Africa",
+    "Eastern Cape": "South Africa", "Northern Cape": "South Africa", "KwaZulu-Natal": "South Africa",
+    "Free State": "South Africa", "Limpopo": "South Africa", "Mpumalanga": "South Africa",
+    "North West Province": "South Africa",
+    # South Sudan
+    "Juba": "South Sudan", "Malakal": "South Sudan",
+    # Sudan
+    "Khartoum": "Sudan", "Omdurman": "Sudan", "Port Sudan": "Sudan", "Kassala": "Sudan",
+    # Tanzania
+    "Dar es Salaam": "Tanzania", "Dodoma": "Tanzania", "Arusha": "Tanzania", "Mwanza": "Tanzania",
+    "Zanzibar": "Tanzania", "Mbeya": "Tanzania", "Morogoro": "Tanzania", "Tanga": "Tanzania",
+    "Moshi": "Tanzania",
+    # Togo
+    "Lomé": "Togo", "Lome": "Togo", "Sokodé": "Togo", "Kara, Togo": "Togo",
+    # Tunisia
+    "Tunis": "Tunisia", "Sfax": "Tunisia", "Sousse": "Tunisia", "Bizerte": "Tunisia",
+    "Ariana": "Tunisia", "Les Berges du Lac": "Tunisia",
+    # Uganda
+    "Kampala": "Uganda", "Entebbe": "Uganda", "Gulu": "Uganda", "Mbarara": "Uganda",
+    "Jinja": "Uganda", "Mbale": "Uganda", "Wakiso": "Uganda",
+    # Western Sahara
+    "Laayoune": "Western Sahara", "El Aaiún": "Western Sahara", "Dakhla": "Western Sahara",
+    # Zambia
+    "Lusaka": "Zambia", "Ndola": "Zambia", "Kitwe": "Zambia", "Livingstone": "Zambia",
+    "Copperbelt": "Zambia",
+    # Zimbabwe
+    "Harare": "Zimbabwe", "Bulawayo": "Zimbabwe", "Mutare": "Zimbabwe", "Gweru": "Zimbabwe",
+    "Masvingo": "Zimbabwe",
+}
@@ -0,0 +1,144 @@
+from datetime import datetime, timezone
+from urllib.parse import urlencode, urlparse
+import hashlib
+import logging
+import json
+import gzip
+import os
+from app.scrapper_functions.http_client import client
+
+
+logger = logging.getLogger(__name__)
+
+
+class FixtureMissing(Exception):
+    """Raised in replay mode when no fixture was recorded for a request."""
+
+
+class FetchedResponse:
+    """The parts of an HTTP response the scrapers use, detached from any connection."""
+
+    def __init__(self, url: str, status_code: int, text: str, headers: dict = None):
+        self.url = url
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class LiveFetcher:
+    """Fetches over the network: HTTP through the shared client, pages through Selenium."""
+
+    def get(self, url: str, params: dict = None, **kwargs) -> FetchedResponse:
+        """Sends a GET through `http_client.client`; kwargs are passed on to it."""
+        response = client.get(url, params=params, **kwargs)
+        return FetchedResponse(
+            response.url, response.status_code, response.text,
+            {"Content-Type": response.headers.get("Content-Type", "")})
+
+    def render(self, url: str, load) -> str:
+        """Returns the page source produced by `load()`, which drives the browser."""
+        return load()
+
+
+def fixture_key(kind: str, url: str, params: dict = None) -> str:
+    """Returns the stable fixture name of a request (host directory plus digest)."""
+    query = urlencode(sorted((params or {}).items()), doseq=True)
+    digest = hashlib.sha1(f"{kind} {url}?{query}".encode("utf-8")).hexdigest()
+    return os.path.join(urlparse(url).netloc or "local", f"{kind}-{digest[:20]}.json.gz")
+
+
+class RecordingFetcher(LiveFetcher):
+    """Fetches live and saves every response (except 5xx) as a gzip-compressed fixture.
+
+    Args:
+        directory (str): Fixture directory; created if missing.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _save(self, kind: str, url: str, params: dict, status: int, text: str, headers: dict = None):
+        path = os.path.join(self.directory, fixture_key(kind, url, params))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump({
+                "kind": kind,
+                "url": url,
+                "params": params or {},
+                "status": status,
+                "headers": headers or {},
+                "text": text,
+                "recorded_at": datetime.now(timezone.utc).isoformat(),
+            }, f)
+
+    def get(self, url: str, params: dict = None, **kwargs) -> FetchedResponse:
+        response = super().get(url, params=params, **kwargs)
+        if response.status_code < 500:
+            self._save("get", url, params, response.status_code,
+                       response.text, response.headers)
+        return response
+
+    def render(self, url: str, load) -> str:
+        html = super().render(url, load)
+        self._save("render", url, None, 200, html)
+        return html
+
+
+class ReplayFetcher:
+    """Serves recorded fixtures and never touches the network or a browser.
+
+    Args:
+        directory (str): Fixture directory written by a `RecordingFetcher`.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _load(self, kind: str, url: str, params: dict = None) -> dict:
+        path = os.path.join(self.directory, fixture_key(kind, url, params))
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise FixtureMissing(f"No fixture for {kind} {url} {params or ''}")
+
+    def get(self, url: str, params: dict = None, **kwargs) -> FetchedResponse:
+        fixture = self._load("get", url, params)
+        return FetchedResponse(url, fixture["status"], fixture["text"], fixture["headers"])
+
+    def render(self, url: str, load) -> str:
+        return self._load("render", url)["text"]
+
+
+def make_fetcher(mode: str, directory: str):
+    """Builds the fetcher for FETCH_MODE "live", "record" or "replay"."""
+    if mode == "record":
+        return RecordingFetcher(directory)
+    if mode == "replay":
+        return ReplayFetcher(directory)
+    if mode != "live":
+        raise ValueError(f"Unknown FETCH_MODE '{mode}'")
+    return LiveFetcher()
+
+
+FETCH_MODE = os.getenv("FETCH_MODE", "live")
+FETCH_FIXTURES_DIR = os.getenv("FETCH_FIXTURES_DIR", "fixtures")
+
+_fetcher = make_fetcher(FETCH_MODE, FETCH_FIXTURES_DIR)
+if FETCH_MODE != "live":
+    logger.info("Fetching in %s mode", FETCH_MODE,
+                extra={"fixtures": FETCH_FIXTURES_DIR})
+
+
+def get_fetcher():
+    """Returns the fetcher every scraper uses."""
+    return _fetcher
+
+
+def set_fetcher(fetcher):
+    """Swaps the fetcher used by every scraper (e.g. to replay fixtures in a benchmark)."""
+    global _fetcher
+    _fetcher = fetcher
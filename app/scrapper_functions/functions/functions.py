@@ -1,19 +1,36 @@
-from country_named_entity_recognition import find_countries
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import requests
 from datetime import datetime
 from bs4 import BeautifulSoup
 import re
 from urllib.parse import urlparse, parse_qs, unquote
 from collections import Counter
-from pymongo import MongoClient
-from dotenv import load_dotenv
-import polars as pl
-import africamonitor as am
+from concurrent.futures import ThreadPoolExecutor
+import logging
 import os
+from app.scrapper_functions.search import ddg_search
+from app.scrapper_functions import wikipedia
+from app.scrapper_functions.fetcher import get_fetcher
+from app.scrapper_functions.cancellation import check_cancelled
+from app.metrics import timed
+from app.scrapper_functions.country_matcher import get_matcher
+from app.scrapper_functions.gazetteer import gazetteer
+from app.scrapper_functions.ner import find_country_codes
+from app.scrapper_functions.data.data import country_codes
+
+
+logger = logging.getLogger(__name__)
+
+WORLD_BANK_API_URL = os.getenv(
+    "WORLD_BANK_API_URL", "https://api.worldbank.org/v2")
+# Countries per request; the joined codes must stay within the URL length limit
+WORLD_BANK_BATCH_SIZE = int(os.getenv("WORLD_BANK_BATCH_SIZE", "60"))
+WORLD_BANK_PAGE_SIZE = 1000
+WORLD_BANK_WORKERS = int(os.getenv("WORLD_BANK_WORKERS", "8"))
+
+# The DuckDuckGo HTML endpoint; overridable to point the scrapers at a stub
+DDG_HTML_URL = os.getenv("DDG_HTML_URL", "https://html.duckduckgo.com/html/?q=")
 
 
 def url(company: str, search_type: str) -> tuple[str, str]:
@@ -22,18 +39,21 @@ def url(company: str, search_type: str) -> tuple[str, str]:
     Args:
         company (str): The name of the company to search for.
         search_type (str): The type of search to perform.
-            Accepts "wiki" for Wikipedia, "stats" for Growjo stats, 'crunch' for crunchbase stats, or any other value for general country of origin.
+            Accepts "wiki" for Wikipedia, "stats" for Growjo stats, 'crunch' for crunchbase stats,
+            'investors' for the investor count, or any other value for general country of origin.
 
     Returns:
         str: A full DuckDuckGo HTML search URL for the given company and search type.
     """
-    base_link = "https://html.duckduckgo.com/html/?q="
+    base_link = DDG_HTML_URL
     if search_type == 'wiki':
         keyword = f"{company} company wikipedia"
     elif search_type == 'stats':
         keyword = f"{company} growjo.com company"
     elif search_type == 'crunch':
         keyword = f"{company} crunchbase.com company"
+    elif search_type == 'investors':
+        keyword = f"how many investors does {company} have?"
     else:
         keyword = f"{company} company founded in what country?"
     return base_link, keyword
@@ -97,9 +117,8 @@ def extract_link(res, link_type: str) -> str:
 def extract_most_mentioned_country(full_text: str, african_countries: list) -> str:
     """Identifies the most frequently mentioned African country in a given text.
 
-    Converts the input text to lowercase and searches for exact matches of each country
-    name from the provided list. It counts occurrences using regex word boundaries to
-    avoid partial matches.
+    Counts whole-word mentions of each country name (and its known aliases, e.g.
+    "Côte d'Ivoire" or "DRC") in a single pass of the precompiled `CountryMatcher`.
 
     Args:
         full_text (str): The text in which to search for country mentions.
@@ -108,76 +127,72 @@ def extract_most_mentioned_country(full_text: str, african_countries: list) -> s
     Returns:
         str: The name of the most frequently mentioned country, or an empty string if none are found.
     """
-    full_text = full_text.lower()
-    country_counts = Counter()
+    return get_matcher(african_countries).best(full_text, demonyms=False)
 
-    patterns = {
-        country: re.compile(rf"\b{re.escape(country.lower())}\b")
-        for country in african_countries
-    }
 
-    for country, pattern in patterns.items():
-        matches = pattern.findall(full_text)
-        if matches:
-            country_counts[country] += len(matches)
+def country_from_company_info(company_info: dict, african_countries: list) -> str:
+    """Resolves an African country from the Wikipedia infobox fields alone.
 
-    if country_counts:
-        return country_counts.most_common(1)[0][0]
-
-    return ""
+    Each field is checked with the country NER first. If that finds no country
+    at all, the field is matched against country names and aliases, and then
+    against the bundled gazetteer of African cities and regions, so values such
+    as "Lagos" or "Westlands, Nairobi" resolve without a network search.
 
+    Args:
+        company_info (dict): Infobox data as returned by `get_wiki_link`.
+        african_countries (list): A list of African country names.
 
-def find_country_of_origin(company: str, african_countries: list, company_info: dict, african_demonyms: dict, driver) -> str:
-    """
-    Attempts to determine the African country of origin for a given company.
-    Only returns a result if it is in the list of African countries.
+    Returns:
+        str: The country found in the "headquarters" or "country" fields, or an empty string.
     """
     country_markers = ["headquarters", "country"]
+    codes_country = {v: k for k, v in country_codes.items()}
 
-    # 1. Check known company_info fields
     for marker in country_markers:
         if marker in company_info:
-            result = find_countries(company_info[marker])
+            result = find_country_codes(company_info[marker])
             if result:
-                country_name = result[0][0].name
+                alpha_3, country_name = result[0]
+                # NER names can differ from ours ("Congo, The Democratic Republic of the")
+                country_name = codes_country.get(alpha_3, country_name)
                 if country_name in african_countries:
                     return country_name
-            continue
+                continue
+
+            # No country named at all: try aliases, then African cities and regions
+            country_name = get_matcher(african_countries).best(
+                company_info[marker], demonyms=False) or gazetteer.country(company_info[marker])
+            if country_name in african_countries:
+                return country_name
+
+    return ""
+
+
+def find_country_of_origin(company: str, african_countries: list, company_info: dict, african_demonyms: dict, driver) -> str:
+    """
+    Attempts to determine the African country of origin for a given company.
+    Only returns a result if it is in the list of African countries.
+    """
+    # 1. Check known company_info fields
+    country = country_from_company_info(company_info, african_countries)
+    if country:
+        return country
 
     # 2. Perform DuckDuckGo search
     try:
         base, query = url(company, 'country')
-        driver.get(base)
-
-        WebDriverWait(driver, 5).until(
-            EC.presence_of_element_located((By.NAME, "q")))
-        search_input = driver.find_element(By.NAME, "q")
-        search_input.clear()
-        search_input.send_keys(query)
-        search_input.send_keys(Keys.RETURN)
-
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
+        soup = ddg_search(base, query, driver)
 
         elements = soup.find_all("div", class_="result")
-        full_text = " ".join(set(el.text.strip() for el in elements)).lower()
+        full_text = " ".join(set(el.text.strip() for el in elements))
 
-        country = extract_most_mentioned_country(full_text, african_countries)
+        # Country names, aliases and demonyms are scored in one pass
+        country = get_matcher(african_countries, african_demonyms).best(full_text)
         if country in african_countries:
             return country
 
-        reversed_map = {v.lower(): k for k, v in african_demonyms.items()}
-        for demonym in reversed_map:
-            if demonym in full_text:
-                return reversed_map[demonym]
-
-        for country in african_countries:
-            pattern = r"\b(?:in|from|based in|located in|headquartered in|a[n]?|an)?\s*" + re.escape(
-                country.lower()) + r"\b"
-            if re.search(pattern, full_text):
-                return country
-
     except Exception as e:
-        print(f"Error finding country of origin: {e}")
+        logger.warning("Error finding country of origin: %s", e)
 
     return ""
 
@@ -273,30 +288,18 @@ def extract_investor_no(company_name: str, driver) -> int:
              Returns 0 if no relevant information is found.
     """
 
-    search = f"how many investors does {company_name} have?"
-    target_url = 'https://html.duckduckgo.com/html/'
-
     full_text = ""
 
     try:
-        driver.get(target_url)
-
-        WebDriverWait(driver, 5).until(
-            EC.presence_of_element_located((By.NAME, "q")))
-        search_input = driver.find_element(By.NAME, "q")
-        search_input.clear()
-        search_input.send_keys(search)
-        search_input.send_keys(Keys.RETURN)
-
-        page = driver.page_source
-        soup = BeautifulSoup(page, 'html.parser')
+        base, query = url(company_name, 'investors')
+        soup = ddg_search(base, query, driver)
         elements = soup.find_all('div', class_='result')
 
         full_text = " ".join({el.text.strip().lower()
                              for el in elements})
 
     except Exception as e:
-        print(f"[Search error] {e}")
+        logger.warning("Investor search failed: %s", e)
         return 0
 
     # Pattern matching different possible investor-related phrases
@@ -322,12 +325,12 @@ def extract_investor_no(company_name: str, driver) -> int:
             return Counter(numbers).most_common(1)[0][0]
 
     except Exception as e:
-        print(f"[Regex error] {e}")
+        logger.warning("Investor count parsing failed: %s", e)
 
     return 0
 
 
-def get_company_stats(company_name: str, driver) -> tuple:
+def get_company_stats(company_name: str, driver, include_investors: bool = True) -> tuple:
     """Fetches company statistics such as competitors, funding information, and basic company details.
 
     This function performs a DuckDuckGo search for the company"s Growjo page and scrapes it to extract:
@@ -338,6 +341,8 @@ def get_company_stats(company_name: str, driver) -> tuple:
 
     Args:
         company_name (str): The name of the company to retrieve statistics for.
+        include_investors (bool): Whether to run the investor-count search here. The
+            pipeline passes False and runs `extract_investor_no` as its own stage.
 
     Returns:
         tuple: A tuple containing:
@@ -359,29 +364,26 @@ def get_company_stats(company_name: str, driver) -> tuple:
     """
     try:
         target_url, query = url(company_name, 'stats')
-
-        driver.get(target_url)
-        WebDriverWait(driver, 5).until(
-            EC.presence_of_element_located((By.NAME, "q")))
-
-        search_input = driver.find_element(By.NAME, "q")
-        search_input.clear()
-        search_input.send_keys(query)
-        search_input.send_keys(Keys.RETURN)
-
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
+        soup = ddg_search(target_url, query, driver)
         search_results = soup.find("div", class_="results")
 
         main_link = extract_link(search_results, "growjo.com")
         if not main_link:
             raise Exception("Growjo link not found in search results")
 
-        driver.get(main_link)
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "main")))
-        grow_soup = BeautifulSoup(driver.page_source, "html.parser")
+        check_cancelled()
+
+        def load():
+            driver.get(main_link)
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.TAG_NAME, "main")))
+            return driver.page_source
+
+        with timed("growjo_load"):
+            html = get_fetcher().render(main_link, load)
+        grow_soup = BeautifulSoup(html, "html.parser")
     except Exception as e:
-        print(f"[Navigation Error] {e}")
+        logger.warning("Growjo navigation failed: %s", e)
         return {}, {}, {}
 
     # --- Initialize Outputs ---
@@ -391,7 +393,7 @@ def get_company_stats(company_name: str, driver) -> tuple:
     # --- Industry ---
     try:
         info_div = grow_soup.find("div", id="revenue-financials")
-        print(f"info_div: {info_div}")
+        logger.debug("Growjo revenue-financials block: %s", info_div)
 
         if info_div:
             for a in info_div.find_all("a"):
@@ -399,7 +401,7 @@ def get_company_stats(company_name: str, driver) -> tuple:
                     industry = a.text.strip()
                     break
     except Exception as e:
-        print(f"[Industry Parsing Error] {e}")
+        logger.warning("Industry parsing failed: %s", e)
 
     tables = grow_soup.find_all("table", class_="cstm-table")
 
@@ -413,7 +415,7 @@ def get_company_stats(company_name: str, driver) -> tuple:
                 competitors = extract_table_data(table)
                 break
     except Exception as e:
-        print(f"[Competitors Table Error] {e}")
+        logger.warning("Competitors table parsing failed: %s", e)
 
     # --- Funding ---
     try:
@@ -425,23 +427,25 @@ def get_company_stats(company_name: str, driver) -> tuple:
                 funding = extract_table_data(table)
                 break
     except Exception as e:
-        print(f"[Funding Table Error] {e}")
+        logger.warning("Funding table parsing failed: %s", e)
 
     # --- Company Details ---
     try:
         info_div = grow_soup.find("div", class_="col-md-5")
         lis = [li.text.strip() for li in info_div.find_all("li")]
     except Exception as e:
-        print(f"[Company Info Extraction Error] {e}")
+        logger.warning("Company info extraction failed: %s", e)
         lis = []
 
     company_info = extract_company_details(lis)
 
-    try:
-        company_info["investors"] = extract_investor_no(company_name, driver)
-    except Exception as e:
-        print(f"[Investor Extraction Error] {e}")
-        company_info["investors"] = 0
+    company_info["investors"] = 0
+    if include_investors:
+        try:
+            company_info["investors"] = extract_investor_no(
+                company_name, driver)
+        except Exception as e:
+            logger.warning("Investor extraction failed: %s", e)
 
     company_info["industry"] = industry
 
@@ -525,125 +529,186 @@ def get_company_stats(company_name: str, driver) -> tuple:
 #     return address, country, employees
 
 
+def parse_wiki_lead(html: str) -> tuple:
+    """Parses the infobox and description out of a Wikipedia lead section.
+
+    Args:
+        html (str): The rendered lead section, as returned by `wikipedia.fetch_lead`.
+
+    Returns:
+        tuple: A tuple containing:
+            - dict: Infobox fields keyed by lowercased label, with money values normalized.
+            - str: The first non-empty paragraph, without reference markers.
+
+    Raises:
+        Exception: If the lead section does not describe a company.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+
+    # Extract information from the company infobox (if available)
+    infobox = soup.find("table", class_="infobox")
+    info_label, info_data = [], []
+
+    if infobox:
+        rows = infobox.find_all("tr")
+        for row in rows:
+            try:
+                label = row.find("th")
+                data = row.find("td")
+                if label and data:
+                    info_label.append(label.text.strip())
+                    info_data.append(data.text.strip())
+            except:
+                continue
+
+    # Extract a brief company description (the first non-empty paragraph)
+    large_text = soup.find("div", class_="mw-parser-output") or soup
+    desc = ""
+    for p_tag in large_text.find_all("p"):
+        desc = p_tag.text.strip()
+        if desc:
+            break
+
+    # Clean up the description by removing reference links
+    new_dsc = re.sub(r"\[\d*\]", "", desc)
+
+    # Verify that the company name appears to be a valid company
+    company_keywords = ["company", "startup", "corporation", "firm",
+                        "organization", "business", "enterprise", "subsidiary"]
+
+    text = large_text.get_text(" ", strip=True).casefold()
+    if not any(keyword in text for keyword in company_keywords):
+        raise Exception("Name entered is most likely not a company.")
+
+    # Process the extracted financial and business data
+    company_info = {}
+    units = ["hundred", "thousand", "million", "billion", "trillion"]
+
+    for i in range(len(info_label)):
+        money_field = any(unit in info_data[i].lower() for unit in units)
+
+        # Extract and clean money-related fields
+        if money_field:
+            pattern = r"US\$\d+.?\d+ \w+"
+            res = re.search(pattern, info_data[i])
+            if res:
+                company_info[info_label[i].lower()] = res.group()
+            else:
+                company_info[info_label[i].lower()] = re.sub(
+                    r"\[\d*\]", "", info_data[i])
+        else:
+            company_info[info_label[i].lower()] = re.sub(r"\[\d*\]", "", info_data[i].replace(
+                "\n", ", ").replace(",,", ","))
+
+    website_row = infobox.find("a", href=True) if infobox else None
+    if website_row and "http" in website_row["href"]:
+        company_info["website"] = website_row["href"]
+
+    return company_info, new_dsc
+
+
 def get_wiki_link(company: str, driver) -> tuple:
-    """Fetches the Wikipedia link and relevant company information.
+    """Fetches the Wikipedia article and relevant company information.
 
-    This function performs a DuckDuckGo search for the company"s Wikipedia page and scrapes the following:
+    The article is resolved through the Wikipedia search API (falling back to a
+    DuckDuckGo search), and only its lead section is fetched through the parse
+    API. The following are scraped from it:
     - Company name
     - Key financial and business information (e.g., revenue, valuation)
     - A brief company description (summary paragraph from Wikipedia)
 
     Args:
         company (str): The name of the company to retrieve information for.
+        driver: A Selenium WebDriver instance, only used if the DuckDuckGo fallback needs it.
 
     Returns:
         tuple: A tuple containing:
             - str: The name of the company.
             - dict: A dictionary containing key company information (e.g., revenue, valuation).
             - str: A brief description of the company.
+            - dict: The article's "title", "pageid" and "revid", used to skip refreshes
+              of unchanged articles.
 
     Raises:
         Exception: If the company is not found or if there are issues with scraping Wikipedia.
     """
 
     try:
-        base, query = url(company, 'wiki')
-        driver.get(base)
-        WebDriverWait(driver, 5).until(
-            EC.presence_of_element_located((By.NAME, "q")))
-
-        search_input = driver.find_element(By.NAME, "q")
-        search_input.clear()
-        search_input.send_keys(query)
-        search_input.send_keys(Keys.RETURN)
-
-        page = driver.page_source
-        soup = BeautifulSoup(page, 'html.parser')
-        result = soup.find("div", class_="results")
-
-        # Extract the Wikipedia URL and fetch the page content
-        uri = extract_link(result, "en.wikipedia.org")
-        response = requests.get(uri)
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        # Extract the company name from the Wikipedia page
         try:
-            company_name = soup.find(
-                "span", class_="mw-page-title-main").text.strip()
-        except:
-            company_name = company
-
-        # Extract information from the company infobox (if available)
-        infobox = soup.find("table", class_="infobox")
-        info_label, info_data = [], []
-
-        if infobox:
-            rows = infobox.find_all("tr")
-            for row in rows:
-                try:
-                    label = row.find("th")
-                    data = row.find("td")
-                    if label and data:
-                        info_label.append(label.text.strip())
-                        info_data.append(data.text.strip())
-                except:
-                    continue
-
-        # Extract a brief company description
-        large_text = soup.find("div", class_="mw-body-content")
-        desc = ""
-        if large_text:
-            p_tag = large_text.find("p")
-            if p_tag:
-                desc = p_tag.text.strip()
-
-        # Clean up the description by removing reference links
-        new_dsc = re.sub(r"\[\d*\]", "", desc)
-
-        # Verify that the company name appears to be a valid company
-        company_keywords = ["company", "startup", "corporation", "firm",
-                            "organization", "business", "enterprise", "subsidiary"]
-
-        text = large_text.get_text(" ", strip=True).casefold()
-        if not any(keyword in text for keyword in company_keywords):
-            raise Exception("Name entered is most likely not a company.")
-
-        # Process the extracted financial and business data
-        company_info = {}
-        units = ["hundred", "thousand", "million", "billion", "trillion"]
-
-        for i in range(len(info_label)):
-            money_field = any(unit in info_data[i].lower() for unit in units)
-
-            # Extract and clean money-related fields
-            if money_field:
-                pattern = r"US\$\d+.?\d+ \w+"
-                res = re.search(pattern, info_data[i])
-                if res:
-                    company_info[info_label[i].lower()] = res.group()
-                else:
-                    company_info[info_label[i].lower()] = re.sub(
-                        r"\[\d*\]", "", info_data[i])
-            else:
-                company_info[info_label[i].lower()] = re.sub(r"\[\d*\]", "", info_data[i].replace(
-                    "\n", ", ").replace(",,", ","))
-
-        website_row = infobox.find("a", href=True)
-        if website_row and "http" in website_row["href"]:
-            company_info["website"] = website_row["href"]
-
-        return company_name, company_info, new_dsc
+            title = wikipedia.search_title(f"{company} company")
+        except Exception as e:
+            logger.warning("Wikipedia search API failed: %s", e)
+            title = None
+
+        if not title:
+            base, query = url(company, 'wiki')
+            result = ddg_search(base, query, driver).find(
+                "div", class_="results")
+            title = wikipedia.title_from_url(
+                extract_link(result, "en.wikipedia.org"))
+
+        # Fetch only the lead section, which holds the infobox and summary
+        page = wikipedia.fetch_lead(title)
+        company_name = page["title"] or company
+        company_info, new_dsc = parse_wiki_lead(page["html"])
+
+        page_info = {key: page[key] for key in ("title", "pageid", "revid")}
+        return company_name, company_info, new_dsc, page_info
     except Exception as e:
-        print(f"Something went wrong while scrapping from wikipedia: {e}")
+        logger.warning("Something went wrong while scrapping from wikipedia: %s", e)
         raise Exception(
             f"Something went wrong while scrapping from wikipedia: {e}")
 
 
+def fetch_world_bank_indicator(country_codes: list, indicator: str) -> tuple:
+    """Fetches the most recent value of one World Bank indicator for many countries.
+
+    All countries go into a single `BWA;GHA;...` request limited to the most
+    recent value (`mrv=1`), so each country contributes one row; extra pages,
+    if any, are followed.
+
+    Args:
+        country_codes (list): ISO 3166-1 alpha-3 codes.
+        indicator (str): The World Bank indicator code.
+
+    Returns:
+        tuple: A tuple containing:
+            - dict: Maps each alpha-3 code to its most recent value (None if missing).
+            - datetime or None: When the World Bank last updated the indicator.
+    """
+    values, last_updated = {}, None
+    page, pages = 1, 1
+
+    while page <= pages:
+        response = get_fetcher().get(
+            f"{WORLD_BANK_API_URL}/country/{';'.join(country_codes)}/indicator/{indicator}",
+            params={"format": "json", "mrv": 1,
+                    "per_page": WORLD_BANK_PAGE_SIZE, "page": page})
+        data = response.json()
+        if len(data) < 2:
+            raise Exception(
+                f"World Bank error for {indicator}: {data[0].get('message', data[0])}")
+
+        meta, rows = data[0], data[1] or []
+        pages = int(meta.get("pages", 1))
+        if "lastupdated" in meta:
+            last_updated = datetime.strptime(meta["lastupdated"], "%Y-%m-%d")
+
+        for row in rows:
+            values.setdefault(row["countryiso3code"], row["value"])
+        page += 1
+
+    return values, last_updated
+
+
 def get_macro_data(country_codes: dict, macro_indicator_dict: dict) -> dict:
     """
     Fetches macroeconomic data from the World Bank API for a list of African countries,
     based on specified macroeconomic indicators.
 
+    Countries are requested in batches of `WORLD_BANK_BATCH_SIZE` per indicator and
+    the batches run concurrently, instead of one request per country and indicator.
+
     Args:
         country_codes (dict): Mapping of country names to their ISO 3166-1 alpha-3 codes.
         macro_indicator_dict (dict): Nested dictionary mapping categories to World Bank indicator codes
@@ -661,28 +726,30 @@ def get_macro_data(country_codes: dict, macro_indicator_dict: dict) -> dict:
                 "updated_at": last updated date
             }
     """
+    codes = list(country_codes.values())
+    indicators = {code: name for category in macro_indicator_dict.values()
+                  for code, name in category.items()}
+    batches = [codes[i:i + WORLD_BANK_BATCH_SIZE]
+               for i in range(0, len(codes), WORLD_BANK_BATCH_SIZE)]
+
+    with ThreadPoolExecutor(max_workers=WORLD_BANK_WORKERS) as executor:
+        futures = {
+            (indicator, i): executor.submit(fetch_world_bank_indicator, batch, indicator)
+            for indicator in indicators for i, batch in enumerate(batches)
+        }
+        results = {key: future.result() for key, future in futures.items()}
 
     macro_data_dict = []
 
-    for country in country_codes.keys():
-        country_code = country_codes[country]
+    for country, country_code in country_codes.items():
         countryMacroData = {"name": country, "data": {}}
+        batch = codes.index(country_code) // WORLD_BANK_BATCH_SIZE
 
-        for cat in macro_indicator_dict.keys():
-            for code in macro_indicator_dict[cat].keys():
-                indicator = code
-                url = f'https://api.worldbank.org/v2/country/{country_code}/indicator/{indicator}?format=json'
-
-                response = requests.get(url)
-                data = response.json()
-
-                if "lastupdated" in data[0].keys():
-                    last_updated_dt = datetime.strptime(
-                        data[0]["lastupdated"], "%Y-%m-%d")
-                    countryMacroData['updated_at'] = last_updated_dt
-
-                countryMacroData['data'][macro_indicator_dict[cat]
-                                         [code]] = data[1][0]['value']
+        for indicator, name in indicators.items():
+            values, last_updated = results[(indicator, batch)]
+            if last_updated:
+                countryMacroData['updated_at'] = last_updated
+            countryMacroData['data'][name] = values.get(country_code)
 
         macro_data_dict.append(countryMacroData)
 
@@ -712,36 +779,48 @@ def get_africamonitor_macro_data(country_codes: dict) -> list:
         'NGDPDPC': 'GDP per capita (USD)',
     }
 
-    load_dotenv()
-    client = MongoClient(os.getenv("MONGO_URI"))
-    db = client[os.getenv("MONGO_DB")]
-    countries = db[os.getenv("MONGO_COLLECTION_TWO")]
+    # Heavy macro dependencies are only loaded when the macro pipeline runs
+    from pymongo import UpdateOne
+    import polars as pl
+    import africamonitor as am
+    from app.db import countries
+
     iso_codes = list(country_codes.values())
     codes_country = {v: k for k, v in country_codes.items()}
 
     # Fetch data
     df = am.data(ctry=iso_codes, series=list(indicator_map.keys()), tfrom=2024)
 
+    # One row per country holding the first 2024 observation of every indicator
+    series = [k for k in indicator_map if k in df.columns]
+    by_code = {
+        row.pop("ISO3"): row
+        for row in df.lazy()
+        .filter(pl.col("Date").dt.year() == 2024)
+        .group_by("ISO3", maintain_order=True)
+        .agg([pl.col(k).first() for k in series])
+        .collect()
+        .to_dicts()
+    }
+
     # Prepare results
-    results = []
+    results, updates = [], []
 
     for code in iso_codes:
+        row = by_code.get(code, {})
         val = {"country": codes_country[code]}
-        country_data = df.filter(pl.col("ISO3") == code).filter(
-            pl.col("Date").dt.year() == 2024)
-
         for k, readable in indicator_map.items():
-            try:
-                val[readable] = country_data[0,
-                                             k] if country_data.shape[0] > 0 else None
-            except:
-                val[readable] = None
-            countries.update_one(
-                {"name": codes_country[code]},
-                {"$set": {f"data.{readable}": val[readable]}}
-            )
+            val[readable] = row.get(k)
 
         results.append(val)
+        updates.append(UpdateOne(
+            {"name": codes_country[code]},
+            {"$set": {f"data.{readable}": val[readable]
+                      for readable in indicator_map.values()}},
+        ))
+
+    # Only existing country documents are updated; none are created here
+    matched = countries.bulk_write(updates, ordered=False).matched_count if updates else 0
 
-    print("Done")
+    logger.info("Stored Africa Monitor data", extra={"countries": matched})
     return results
@@ -0,0 +1,56 @@
+import re
+from app.keys import normalize_key
+from app.scrapper_functions.data.gazetteer import african_places
+
+
+def tokenize(text: str) -> list:
+    """Splits text into accent-stripped, casefolded word tokens ("Port-Gentil" -> ["port", "gentil"])."""
+    return re.findall(r"\w+", normalize_key(text))
+
+
+class Gazetteer:
+    """Resolves place names to countries with a token trie.
+
+    Place names are stored as token sequences, so "Dar es Salaam",
+    "dar-es-salaam" and "DAR ES SALAAM" all match, and a lookup walks the
+    tokens of the text once, taking the longest place name at each position.
+
+    Args:
+        places (dict): Mapping of place name to country name.
+    """
+
+    def __init__(self, places: dict):
+        self.trie = {}
+        for place, country in places.items():
+            node = self.trie
+            for token in tokenize(place):
+                node = node.setdefault(token, {})
+            node[None] = country
+
+    def find(self, text: str) -> list:
+        """Returns the countries of all places mentioned in `text`, in order of mention."""
+        tokens = tokenize(text) if text else []
+        found = []
+        i = 0
+        while i < len(tokens):
+            node, match, end = self.trie, None, i
+            for j in range(i, len(tokens)):
+                node = node.get(tokens[j])
+                if node is None:
+                    break
+                if None in node:
+                    match, end = node[None], j + 1
+            if match:
+                found.append(match)
+                i = end
+            else:
+                i += 1
+        return found
+
+    def country(self, text: str) -> str:
+        """Returns the country of the first place mentioned in `text`, or an empty string."""
+        found = self.find(text)
+        return found[0] if found else ""
+
+
+gazetteer = Gazetteer(african_places)
@@ -0,0 +1,123 @@
+from email.utils import parsedate_to_datetime
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+from urllib.parse import urlparse
+from datetime import datetime, timezone
+import requests
+import threading
+import random
+import time
+import os
+
+
+# Responses worth retrying; everything else is returned to the caller as is
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class HttpClient:
+    """A shared outbound HTTP client.
+
+    Wraps one `requests.Session` whose adapter keeps a keep-alive connection
+    pool per host. Every request gets default connect/read timeouts, and
+    compressed responses are negotiated (gzip and deflate, plus brotli when
+    the optional `brotli` package is installed). Connection errors, timeouts
+    and retryable statuses are retried a bounded number of times with
+    jittered exponential backoff, honouring `Retry-After`. A semaphore per
+    host caps the number of requests in flight to it.
+
+    Args:
+        timeout (tuple): Default connect and read timeouts in seconds.
+        retries (int): Default number of retries after the first attempt.
+        backoff (float): Base backoff in seconds, doubled on every retry.
+        max_backoff (float): Upper bound on a single backoff sleep.
+        host_concurrency (int): Default maximum in-flight requests per host.
+        host_limits (dict): Per-host overrides of `host_concurrency`.
+        pool_size (int): Connections kept alive per host.
+    """
+
+    def __init__(self, timeout: tuple = (5, 15), retries: int = 2, backoff: float = 0.5,
+                 max_backoff: float = 8, host_concurrency: int = 8, host_limits: dict = None,
+                 pool_size: int = 16):
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.host_concurrency = host_concurrency
+        self.host_limits = host_limits or {}
+        self._semaphores = {}
+        self._lock = threading.Lock()
+
+        self.session = requests.Session()
+        self.session.headers["Accept-Encoding"] = DEFAULT_ACCEPT_ENCODING
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if host not in self._semaphores:
+                limit = self.host_limits.get(host, self.host_concurrency)
+                self._semaphores[host] = threading.BoundedSemaphore(limit)
+            return self._semaphores[host]
+
+    def _delay(self, attempt: int, response=None) -> float:
+        """Returns how long to sleep before retry number `attempt` (from 0)."""
+        retry_after = response.headers.get(
+            "Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                return min(float(retry_after), self.max_backoff)
+            except ValueError:
+                try:
+                    when = parsedate_to_datetime(retry_after)
+                    wait = (when - datetime.now(timezone.utc)).total_seconds()
+                    return min(max(wait, 0), self.max_backoff)
+                except (TypeError, ValueError):
+                    pass
+        # Full jitter: a uniform sleep up to the exponential backoff
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def request(self, method: str, url: str, retries: int = None, **kwargs) -> requests.Response:
+        """Sends a request, retrying transient failures.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The absolute URL.
+            retries (int): Overrides the client's default number of retries.
+            **kwargs: Passed on to `requests.Session.request` (params, headers, timeout, ...).
+
+        Returns:
+            requests.Response: The final response, which may still carry a retryable
+            status if every attempt returned one.
+
+        Raises:
+            requests.RequestException: If the last attempt failed to connect or timed out.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        retries = self.retries if retries is None else retries
+        semaphore = self._semaphore(urlparse(url).netloc)
+
+        for attempt in range(retries + 1):
+            response = None
+            try:
+                with semaphore:
+                    response = self.session.request(method, url, **kwargs)
+                if response.status_code not in RETRY_STATUSES or attempt == retries:
+                    return response
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == retries:
+                    raise
+            time.sleep(self._delay(attempt, response))
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Sends a GET request (see `request`)."""
+        return self.request("GET", url, **kwargs)
+
+
+# The process-wide client used for every outbound fetch
+client = HttpClient(
+    timeout=(float(os.getenv("HTTP_CONNECT_TIMEOUT", "5")),
+             float(os.getenv("HTTP_READ_TIMEOUT", "15"))),
+    retries=int(os.getenv("HTTP_RETRIES", "2")),
+    host_concurrency=int(os.getenv("HTTP_HOST_CONCURRENCY", "8")),
+)
@@ -0,0 +1,75 @@
+from functools import lru_cache
+import logging
+import os
+import threading
+import time
+
+
+logger = logging.getLogger(__name__)
+
+NER_CACHE_SIZE = int(os.getenv("NER_CACHE_SIZE", "4096"))
+
+_backend = None
+_lock = threading.Lock()
+_stats = {
+    "load_seconds": None,
+    "calls": 0,
+    "call_seconds_total": 0.0,
+    "call_seconds_max": 0.0,
+}
+
+
+def _load_backend():
+    """Imports the country NER on first use; every later call shares it."""
+    global _backend
+    if _backend is None:
+        with _lock:
+            if _backend is None:
+                start = time.perf_counter()
+                from country_named_entity_recognition import find_countries
+                _stats["load_seconds"] = time.perf_counter() - start
+                _backend = find_countries
+                logger.info("Loaded country NER in %.3fs", _stats["load_seconds"])
+    return _backend
+
+
+@lru_cache(maxsize=NER_CACHE_SIZE)
+def find_country_codes(text: str) -> tuple:
+    """Finds the countries named in `text` with the country NER, memoized by input.
+
+    Headquarters strings repeat heavily across companies, so results are kept
+    in a bounded LRU. The NER backend is only imported on the first miss.
+
+    Args:
+        text (str): The text to scan (e.g. an infobox "headquarters" value).
+
+    Returns:
+        tuple: `(alpha_3, name)` pairs for every country found, in order of mention.
+    """
+    find_countries = _load_backend()
+
+    start = time.perf_counter()
+    result = find_countries(text)
+    elapsed = time.perf_counter() - start
+
+    with _lock:
+        _stats["calls"] += 1
+        _stats["call_seconds_total"] += elapsed
+        _stats["call_seconds_max"] = max(_stats["call_seconds_max"], elapsed)
+
+    return tuple((country.alpha_3, country.name) for country, _ in result)
+
+
+def ner_metrics() -> dict:
+    """Returns the NER load time, backend call latency and memoization counters."""
+    info = find_country_codes.cache_info()
+    with _lock:
+        stats = dict(_stats)
+    stats.update({
+        "loaded": _backend is not None,
+        "cache_hits": info.hits,
+        "cache_misses": info.misses,
+        "cache_size": info.currsize,
+        "cache_max_size": info.maxsize,
+    })
+    return stats
@@ -0,0 +1,222 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import logging
+import os
+from app.keys import company_key
+from app.metrics import timed
+from app.scrapper_functions.cancellation import StageCancelled, cancel_scope
+from app.scrapper_functions.data.data import african_countries, african_demonyms
+from app.scrapper_functions.functions.functions import (
+    get_wiki_link, find_country_of_origin, country_from_company_info,
+    get_company_stats, extract_investor_no)
+
+
+logger = logging.getLogger(__name__)
+
+# Stage threads are separate from the request-level scrape executor, so a scrape
+# waiting on its stages can never starve them of workers.
+stage_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("PIPELINE_STAGE_WORKERS", "8")),
+    thread_name_prefix="stage")
+
+
+class LazyDriver:
+    """Stands in for a WebDriver and only checks one out of `pool` when used.
+
+    Each stage gets its own LazyDriver, so stages that are served entirely
+    over HTTP never occupy a Chrome instance, while stages that need the
+    browser (the Growjo page, or a search fallback) get a dedicated one.
+
+    Once the stage's `cancel` flag is set, the next use of the driver checks it
+    back in and raises `StageCancelled` instead of borrowing or driving Chrome.
+    """
+
+    def __init__(self, pool, cancel: threading.Event = None):
+        self._pool = pool
+        self._cancel = cancel or threading.Event()
+        self._driver = None
+
+    def __getattr__(self, name):
+        if self._cancel.is_set():
+            self.release()
+            raise StageCancelled("Stage cancelled")
+        if self._driver is None:
+            self._driver = self._pool.checkout()
+        return getattr(self._driver, name)
+
+    def release(self):
+        """Checks the underlying driver back in, if one was ever checked out."""
+        if self._driver is not None:
+            self._pool.checkin(self._driver)
+            self._driver = None
+
+
+def _run_stage(pool, stage: str, fn, company: str, report, cancel: threading.Event = None):
+    cancel = cancel or threading.Event()
+    if cancel.is_set():
+        raise StageCancelled("Stage cancelled")
+    report("running")
+    driver = LazyDriver(pool, cancel)
+    try:
+        with cancel_scope(cancel), timed(stage):
+            result = fn(company, driver)
+    except Exception:
+        report("failed")
+        raise
+    finally:
+        driver.release()
+    report("done")
+    return result
+
+
+def _wiki(company: str, driver):
+    return get_wiki_link(company, driver)
+
+
+def _country(company: str, driver):
+    return find_country_of_origin(company, african_countries, {}, african_demonyms, driver)
+
+
+def _stats(company: str, driver):
+    return get_company_stats(company, driver, include_investors=False)
+
+
+def _investors(company: str, driver):
+    return extract_investor_no(company, driver)
+
+
+# The pipeline DAG: every name stage depends on "wiki" for the canonical
+# company name, and "country" additionally on its infobox. The Growjo and
+# investor stages are started speculatively with the raw name alongside "wiki";
+# "country" waits for the infobox, which usually names the country already.
+NAME_STAGES = {
+    "country": _country,
+    "stats": _stats,
+    "investors": _investors,
+}
+ALL_STAGES = ("wiki", *NAME_STAGES)
+
+
+def run_company_pipeline(company: str, pool, executor: ThreadPoolExecutor = stage_executor,
+                         stages: tuple = ALL_STAGES, progress=None) -> dict:
+    """Runs the company scrape stages concurrently.
+
+    The Wikipedia stage and the Growjo and investor stages start together,
+    the latter speculatively with the raw `company` name. Once Wikipedia answers:
+    - if Wikipedia resolved a different canonical name, the speculative stages
+      are cancelled and restarted with that name;
+    - if the infobox names an African country, it is used as is; otherwise the
+      country search starts, with the canonical name.
+    Without "wiki", the country search starts right away.
+
+    Cancellation is cooperative: a cancelled stage that is already running
+    stops at its next request or driver use, and gives its driver back.
+
+    Refreshes can run a subset of `stages`; without "wiki", `company` is
+    taken as the canonical name and the Wikipedia fields come back empty.
+
+    Args:
+        company (str): The company name as entered by the user.
+        pool: The `DriverPool` stages borrow Chrome drivers from.
+        executor (ThreadPoolExecutor): Executor the stages run on.
+        stages (tuple): The stages to run, out of "wiki", "country", "stats" and "investors".
+        progress (callable): Optional `progress(stage, state)` callback, called from the
+            stage threads with "running", "done" or "failed". Only the latest run of a
+            restarted stage reports.
+
+    Returns:
+        dict: A dictionary with keys:
+            - "company": str (canonical name, or `company` if Wikipedia failed)
+            - "company_info_fixed": dict
+            - "company_info": dict
+            - "description": str
+            - "wiki_page": dict (the article's "title", "pageid" and "revid", empty without "wiki")
+            - "country": str (empty if not found)
+            - "competitors": dict
+            - "funding": dict
+            - "errors": dict mapping stage names ("wiki", "country", "stats") to the exception they raised
+    """
+    current = {}
+
+    def reporter(stage: str):
+        token = current[stage] = object()
+
+        def report(state: str):
+            if progress is None or current.get(stage) is not token:
+                return
+            try:
+                progress(stage, state)
+            except Exception as e:
+                logger.warning("Progress callback failed: %s", e)
+        return report
+
+    cancels = {}
+
+    def submit(stage, fn, name):
+        cancel = cancels[stage] = threading.Event()
+        return executor.submit(_run_stage, pool, stage, fn, name, reporter(stage), cancel)
+
+    def abandon(stage, future):
+        cancels[stage].set()
+        future.cancel()
+
+    wiki = submit("wiki", _wiki, company) if "wiki" in stages else None
+    futures = {stage: submit(stage, fn, company)
+               for stage, fn in NAME_STAGES.items()
+               if stage in stages and not (stage == "country" and wiki is not None)}
+    results, errors = {}, {}
+
+    if wiki is not None:
+        try:
+            results["wiki"] = wiki.result()
+        except Exception as e:
+            errors["wiki"] = e
+
+    company_name, company_info, desc, wiki_page = results.get(
+        "wiki") or (None, None, None, None)
+    name = company_name if company_name else company
+    company_info = company_info if company_info else {}
+
+    if company_key(name) != company_key(company):
+        for stage, future in futures.items():
+            abandon(stage, future)
+            futures[stage] = submit(stage, NAME_STAGES[stage], name)
+
+    if wiki is not None and "country" in stages:
+        try:
+            country = country_from_company_info(company_info, african_countries)
+        except Exception as e:
+            logger.warning("Infobox country lookup failed: %s", e)
+            country = ""
+
+        if country:
+            results["country"] = country
+            reporter("country")("done")
+        else:
+            futures["country"] = submit("country", _country, name)
+
+    for stage, future in futures.items():
+        try:
+            results[stage] = future.result()
+        except Exception as e:
+            errors[stage] = e
+
+    if "investors" in errors:
+        logger.warning("Investor extraction failed: %s", errors.pop("investors"))
+
+    competitors, funding, company_information_dict = results.get(
+        "stats") or ({}, {}, {})
+    if company_information_dict:
+        company_information_dict["investors"] = results.get("investors", 0)
+
+    return {
+        "company": name,
+        "company_info_fixed": company_information_dict,
+        "company_info": company_info,
+        "description": desc if desc else "",
+        "wiki_page": wiki_page if wiki_page else {},
+        "country": results.get("country", ""),
+        "competitors": competitors,
+        "funding": funding,
+        "errors": errors,
+    }
@@ -1,11 +1,18 @@
 # Import the required libraries
-from app.scrapper_functions.data.data import african_countries, african_demonyms
-from app.scrapper_functions.functions.functions import get_wiki_link, find_country_of_origin, get_company_stats
+from app.scrapper_functions.pipeline import run_company_pipeline
+from app.metrics import timed
+from collections import deque
+from contextlib import contextmanager
+import threading
+import logging
 import time
 import undetected_chromedriver as uc
 import os
 
 
+logger = logging.getLogger(__name__)
+
+
 def create_driver():
     options = uc.ChromeOptions()
     options.add_argument('--headless=new')
@@ -26,6 +33,213 @@ def create_driver():
     return driver
 
 
+class DriverPoolTimeout(Exception):
+    """Raised when no driver becomes available within the checkout timeout."""
+
+
+class DriverPool:
+    """A bounded pool of warm Chrome drivers shared by all scrapes.
+
+    Drivers are created lazily up to `size` (or ahead of time with `warm`),
+    handed out with `checkout` and returned with `checkin`. A driver is
+    recycled (quit and replaced on demand) once it has served `max_uses`
+    checkouts, is older than `max_age` seconds, or fails its health check.
+
+    Args:
+        size (int): Maximum number of live drivers.
+        max_uses (int): Checkouts a driver may serve before it is recycled.
+        max_age (float): Seconds a driver may live before it is recycled.
+        checkout_timeout (float): Seconds `checkout` waits for a free driver.
+        factory (callable): Creates a new driver. Defaults to `create_driver`.
+    """
+
+    def __init__(self, size: int = 2, max_uses: int = 50, max_age: float = 1800,
+                 checkout_timeout: float = 60, factory=create_driver):
+        self.size = max(1, size)
+        self.max_uses = max_uses
+        self.max_age = max_age
+        self.checkout_timeout = checkout_timeout
+        self._factory = factory
+        self._cond = threading.Condition()
+        self._idle = deque()
+        self._info = {}
+        self._total = 0
+        self._closed = False
+        self._stats = {
+            "created": 0,
+            "checkouts": 0,
+            "checkout_wait_seconds": 0.0,
+            "checkout_timeouts": 0,
+            "recycled_uses": 0,
+            "recycled_age": 0,
+            "recycled_unhealthy": 0,
+            "create_errors": 0,
+        }
+
+    def _create(self):
+        try:
+            with timed("driver_launch"):
+                driver = self._factory()
+        except Exception:
+            with self._cond:
+                self._total -= 1
+                self._stats["create_errors"] += 1
+                self._cond.notify()
+            raise
+
+        with self._cond:
+            self._info[id(driver)] = {"created_at": time.monotonic(), "uses": 0}
+            self._stats["created"] += 1
+        return driver
+
+    def _discard(self, driver, reason: str = None):
+        with self._cond:
+            self._info.pop(id(driver), None)
+            self._total -= 1
+            if reason:
+                self._stats[f"recycled_{reason}"] += 1
+            self._cond.notify()
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning("Error quitting driver: %s", e)
+
+    def _expired(self, driver):
+        info = self._info.get(id(driver))
+        if info is None:
+            return "unhealthy"
+        if info["uses"] >= self.max_uses:
+            return "uses"
+        if time.monotonic() - info["created_at"] >= self.max_age:
+            return "age"
+        return None
+
+    @staticmethod
+    def _healthy(driver) -> bool:
+        try:
+            driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def warm(self, count: int = None):
+        """Starts drivers until `count` (default: the pool size) are idle or live."""
+        target = self.size if count is None else min(count, self.size)
+        while True:
+            with self._cond:
+                if self._closed or self._total >= target:
+                    return
+                self._total += 1
+            try:
+                driver = self._create()
+            except Exception as e:
+                logger.warning("Error warming driver: %s", e)
+                return
+            with self._cond:
+                self._idle.append(driver)
+                self._cond.notify()
+
+    def checkout(self, timeout: float = None):
+        """Takes a healthy driver from the pool, starting one if there is room.
+
+        Raises:
+            DriverPoolTimeout: If every driver stays busy for `timeout` seconds.
+        """
+        timeout = self.checkout_timeout if timeout is None else timeout
+        start = time.monotonic()
+        deadline = start + timeout
+
+        while True:
+            driver = None
+            create = False
+            with self._cond:
+                if self._closed:
+                    raise Exception("Driver pool is closed.")
+                while not self._idle and self._total >= self.size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats["checkout_timeouts"] += 1
+                        raise DriverPoolTimeout(
+                            f"No Chrome driver available after {timeout}s.")
+                    self._cond.wait(remaining)
+                if self._idle:
+                    driver = self._idle.popleft()
+                else:
+                    self._total += 1
+                    create = True
+
+            if create:
+                driver = self._create()
+            else:
+                reason = self._expired(driver)
+                if reason is None and not self._healthy(driver):
+                    reason = "unhealthy"
+                if reason:
+                    self._discard(driver, reason)
+                    continue
+
+            with self._cond:
+                self._info[id(driver)]["uses"] += 1
+                self._stats["checkouts"] += 1
+                self._stats["checkout_wait_seconds"] += time.monotonic() - start
+            return driver
+
+    def checkin(self, driver):
+        """Returns a driver to the pool, recycling it if it has hit a limit."""
+        reason = self._expired(driver)
+        if reason is None and not self._closed:
+            try:
+                driver.get("about:blank")
+            except Exception:
+                reason = "unhealthy"
+
+        if reason or self._closed:
+            self._discard(driver, reason)
+            return
+
+        with self._cond:
+            self._idle.append(driver)
+            self._cond.notify()
+
+    @contextmanager
+    def driver(self, timeout: float = None):
+        """Context manager that checks a driver out and always checks it back in."""
+        driver = self.checkout(timeout)
+        try:
+            yield driver
+        finally:
+            self.checkin(driver)
+
+    def metrics(self) -> dict:
+        """Returns a snapshot of the pool's counters and current occupancy."""
+        with self._cond:
+            stats = dict(self._stats)
+            stats.update({
+                "size": self.size,
+                "live": self._total,
+                "idle": len(self._idle),
+                "in_use": self._total - len(self._idle),
+            })
+        return stats
+
+    def close(self):
+        """Quits every idle driver; drivers in use are quit when checked in."""
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+        for driver in idle:
+            self._discard(driver)
+
+
+driver_pool = DriverPool(
+    size=int(os.getenv("DRIVER_POOL_SIZE", "2")),
+    max_uses=int(os.getenv("DRIVER_MAX_USES", "50")),
+    max_age=float(os.getenv("DRIVER_MAX_AGE_SECONDS", "1800")),
+    checkout_timeout=float(os.getenv("DRIVER_CHECKOUT_TIMEOUT", "60")),
+)
+
+
 def information_scrapper(company: str) -> dict:
     """
     Scrapes and gathers detailed information about a company from multiple sources.
@@ -45,6 +259,7 @@ def information_scrapper(company: str) -> dict:
             - "company_info_fixed": dict
             - "company_info": dict
             - "description": str
+            - "wiki_page": dict
             - "country": str (African only)
             - "competitors": dict
             - "funding": dict
@@ -53,64 +268,42 @@ def information_scrapper(company: str) -> dict:
         Exception: If the company is not identified as African or if critical steps fail.
     """
     start = time.time()
-    driver = create_driver()
     information = {}
 
     try:
-        try:
-            company_name, company_info, desc = get_wiki_link(company, driver)
-        except Exception as e:
-            raise Exception(f"[Wikipedia Error] {e}")
+        result = run_company_pipeline(company, driver_pool)
+        errors = result.pop("errors")
 
-        try:
-            country = find_country_of_origin(
-                company,
-                african_countries,
-                company_info if company_info else {},
-                african_demonyms,
-                driver
-            )
-        except Exception as e:
-            raise Exception(f"[Country Detection Error] {e}")
+        if "wiki" in errors:
+            raise Exception(f"[Wikipedia Error] {errors['wiki']}")
+
+        if "country" in errors:
+            raise Exception(f"[Country Detection Error] {errors['country']}")
 
-        if not country:
+        if not result["country"]:
             raise Exception(
                 f"[Country Match Error] Could not find country of origin for '{company}' among African countries."
             )
 
-        try:
-            name_for_stats = company_name if company_name else company
-            competitors, funding, company_information_dict = get_company_stats(
-                name_for_stats, driver)
-        except Exception as e:
-            raise Exception(f"[Growjo Error] {e}")
-
-        information = {
-            "company": name_for_stats,
-            "company_info_fixed": company_information_dict,
-            "company_info": company_info if company_info else {},
-            "description": desc if desc else "",
-            "country": country,
-            "competitors": competitors,
-            "funding": funding,
-            #"scrape_time_seconds": round(time.time() - start, 2)
-        }
+        if "stats" in errors:
+            raise Exception(f"[Growjo Error] {errors['stats']}")
+
+        information = result
+        #information["scrape_time_seconds"] = round(time.time() - start, 2)
 
         return information
 
     except Exception as e:
-        print(str(e))
+        logger.warning("Scrape failed: %s", e, extra={"company": company})
         return {
             "company": company,
             "error": str(e),
             "company_info_fixed": {},
             "company_info": {},
             "description": "",
+            "wiki_page": {},
             "country": "",
             "competitors": {},
             "funding": {},
             #"scrape_time_seconds": round(time.time() - start, 2)
         }
-
-    finally:
-        driver.quit()
@@ -0,0 +1,143 @@
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from urllib.parse import quote_plus
+from bs4 import BeautifulSoup
+import logging
+import os
+from app.cache import ByteLRUCache
+from app.metrics import timed
+from app.scrapper_functions.fetcher import get_fetcher
+from app.scrapper_functions.cancellation import StageCancelled, check_cancelled
+from app.keys import normalize_key
+
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36"
+
+HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "text/html,application/xhtml+xml",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# Raw result pages keyed by normalized query, shared by every pipeline stage
+search_cache = ByteLRUCache(
+    max_bytes=int(os.getenv("SEARCH_CACHE_MAX_BYTES", str(32 * 1024 * 1024))),
+    ttl=float(os.getenv("SEARCH_CACHE_TTL", str(6 * 3600))),
+    sizeof=lambda html: len(html.encode("utf-8")),
+)
+
+
+def fetch_search_html(base_link: str, query: str, timeout: tuple = (5, 10)) -> str:
+    """Fetches a DuckDuckGo HTML results page with a single GET.
+
+    Args:
+        base_link (str): The DuckDuckGo HTML endpoint ending in `?q=` (see `url`).
+        query (str): The search query.
+        timeout (tuple): Connect and read timeouts in seconds.
+
+    Returns:
+        str: The raw HTML of the results page.
+
+    Raises:
+        Exception: If the request fails or DuckDuckGo does not answer with 200.
+    """
+    check_cancelled()
+    # A single retry: a blocked search falls back to the browser instead
+    response = get_fetcher().get(base_link + quote_plus(query), headers=HEADERS,
+                                 timeout=timeout, retries=1)
+    if response.status_code != 200:
+        raise Exception(
+            f"DuckDuckGo returned status {response.status_code} for '{query}'")
+    return response.text
+
+
+def browser_search_html(base_link: str, query: str, driver) -> str:
+    """Runs a DuckDuckGo search by typing the query into a Selenium browser.
+
+    This is the slow path, used only when the plain HTTP request is blocked
+    or comes back without results.
+
+    Args:
+        base_link (str): The DuckDuckGo HTML endpoint (see `url`).
+        query (str): The search query.
+        driver: A Selenium WebDriver instance.
+
+    Returns:
+        str: The page source of the results page.
+    """
+    check_cancelled()
+
+    def load():
+        driver.get(base_link.split("?")[0])
+        WebDriverWait(driver, 5).until(
+            EC.presence_of_element_located((By.NAME, "q")))
+
+        search_input = driver.find_element(By.NAME, "q")
+        search_input.clear()
+        search_input.send_keys(query)
+        search_input.send_keys(Keys.RETURN)
+
+        return driver.page_source
+
+    return get_fetcher().render(base_link + quote_plus(query), load)
+
+
+def has_results(soup) -> bool:
+    """Checks whether a parsed DuckDuckGo page contains any search results."""
+    return soup.find("div", class_="result") is not None
+
+
+def ddg_search(base_link: str, query: str, driver=None):
+    """Searches DuckDuckGo and returns the parsed results page.
+
+    Result pages are cached by normalized query in `search_cache`, so repeat
+    lookups and refreshes do not reissue identical searches. On a miss the
+    HTML endpoint is queried directly over the shared HTTP client. If that
+    fails or yields no results (e.g. DuckDuckGo serves its bot check), the
+    search falls back to the Selenium `driver` when one is given.
+
+    Args:
+        base_link (str): The DuckDuckGo HTML endpoint ending in `?q=` (see `url`).
+        query (str): The search query.
+        driver: An optional Selenium WebDriver used as a fallback.
+
+    Returns:
+        BeautifulSoup: The parsed results page.
+
+    Raises:
+        Exception: If the HTTP search fails and no driver is available.
+    """
+    key = normalize_key(query)
+    html = search_cache.get(key)
+    if html is not None:
+        return BeautifulSoup(html, "html.parser")
+
+    soup = None
+    try:
+        with timed("ddg_search"):
+            html = fetch_search_html(base_link, query)
+        soup = BeautifulSoup(html, "html.parser")
+        if has_results(soup):
+            search_cache.set(key, html)
+            return soup
+        logger.info("No results over HTTP", extra={"query": query})
+    except StageCancelled:
+        raise
+    except Exception as e:
+        logger.warning("HTTP search failed: %s", e, extra={"query": query})
+
+    if driver is None:
+        if soup is not None:
+            return soup
+        raise Exception(f"DuckDuckGo search failed for '{query}'")
+
+    with timed("ddg_browser_search"):
+        html = browser_search_html(base_link, query, driver)
+    soup = BeautifulSoup(html, "html.parser")
+    if has_results(soup):
+        search_cache.set(key, html)
+    return soup
@@ -0,0 +1,133 @@
+from urllib.parse import unquote, urlparse
+import os
+from app.metrics import timed
+from app.scrapper_functions.http_client import client
+from app.scrapper_functions.fetcher import get_fetcher
+from app.scrapper_functions.cancellation import check_cancelled
+
+
+# The action API accepts at most 50 page ids per query for regular clients
+MAX_PAGES_PER_QUERY = 50
+
+API_URL = os.getenv("WIKIPEDIA_API_URL", "https://en.wikipedia.org/w/api.php")
+
+# Wikimedia asks API clients to identify themselves with a descriptive User-Agent
+USER_AGENT = os.getenv(
+    "WIKIPEDIA_USER_AGENT", "StearsLite/1.0 (https://github.com/Toluwaa-o/lite-api)")
+
+HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "application/json",
+}
+
+
+def api_get(params: dict, timeout: tuple = None) -> dict:
+    """Calls the MediaWiki action API and returns its decoded JSON response.
+
+    Args:
+        params (dict): The action parameters; format and formatversion are added.
+        timeout (tuple): Connect and read timeouts in seconds, defaulting to the client's.
+
+    Returns:
+        dict: The decoded response.
+
+    Raises:
+        Exception: If the request fails or the API answers with an error.
+    """
+    check_cancelled()
+    params = {**params, "format": "json", "formatversion": "2"}
+    with timed(f"wikipedia_{params.get('action')}"):
+        response = get_fetcher().get(API_URL, params=params, headers=HEADERS,
+                                     timeout=timeout or client.timeout)
+    if response.status_code != 200:
+        raise Exception(
+            f"Wikipedia API returned status {response.status_code}")
+    data = response.json()
+    if "error" in data:
+        raise Exception(
+            f"Wikipedia API error: {data['error'].get('info', data['error'])}")
+    return data
+
+
+def search_title(query: str):
+    """Resolves a free-text query to the title of the best matching article.
+
+    Tries the full-text search API first and falls back to opensearch
+    (title prefix matching), which also follows redirects.
+
+    Args:
+        query (str): The search query, e.g. "Paystack company".
+
+    Returns:
+        str or None: The article title, or None if nothing matched.
+    """
+    data = api_get({"action": "query", "list": "search", "srsearch": query,
+                    "srlimit": 1, "srprop": "", "srwhat": "text"})
+    hits = data.get("query", {}).get("search", [])
+    if hits:
+        return hits[0]["title"]
+
+    check_cancelled()
+    response = get_fetcher().get(API_URL, headers=HEADERS, params={
+        "action": "opensearch", "search": query.rsplit(" company", 1)[0],
+        "limit": 1, "namespace": 0, "redirects": "resolve", "format": "json",
+    })
+    if response.status_code == 200:
+        titles = response.json()[1]
+        if titles:
+            return titles[0]
+    return None
+
+
+def title_from_url(uri: str) -> str:
+    """Extracts the article title from an en.wikipedia.org article URL."""
+    path = urlparse(uri).path
+    return unquote(path.split("/wiki/", 1)[-1]).replace("_", " ")
+
+
+def fetch_lead(title: str) -> dict:
+    """Fetches the rendered lead section (with its infobox) of an article.
+
+    Only section 0 is rendered and transferred, rather than the whole article.
+
+    Args:
+        title (str): The article title; redirects are followed.
+
+    Returns:
+        dict: A dictionary with keys:
+            - "title": str (the canonical article title)
+            - "pageid": int
+            - "revid": int (the revision the HTML was rendered from)
+            - "html": str (the lead section HTML)
+    """
+    data = api_get({"action": "parse", "page": title, "prop": "text|revid",
+                    "section": 0, "redirects": 1, "disabletoc": 1,
+                    "disableeditsection": 1, "disablelimitreport": 1})
+    parse = data["parse"]
+    return {
+        "title": parse["title"],
+        "pageid": parse["pageid"],
+        "revid": parse.get("revid"),
+        "html": parse["text"],
+    }
+
+
+def latest_revisions(pageids: list) -> dict:
+    """Looks up the current revision of many articles, 50 per API call.
+
+    Args:
+        pageids (list): Wikipedia page ids.
+
+    Returns:
+        dict: Maps each page id that still exists to its latest revision id.
+    """
+    pageids = list(dict.fromkeys(int(pageid) for pageid in pageids))
+    revisions = {}
+    for i in range(0, len(pageids), MAX_PAGES_PER_QUERY):
+        chunk = pageids[i:i + MAX_PAGES_PER_QUERY]
+        data = api_get({"action": "query", "prop": "info",
+                        "pageids": "|".join(map(str, chunk))})
+        for page in data.get("query", {}).get("pages", []):
+            if not page.get("missing") and "lastrevid" in page:
+                revisions[page["pageid"]] = page["lastrevid"]
+    return revisions
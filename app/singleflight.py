@@ -0,0 +1,101 @@
+import asyncio
+import socket
+import uuid
+from datetime import datetime, timedelta, timezone
+from pymongo.errors import DuplicateKeyError
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key into one in-flight call.
+
+    The first caller for a key starts the work as a task; every caller that
+    arrives while it is running awaits the same task and gets the same result
+    or exception. The task is shielded, so a disconnecting client does not
+    cancel the work for everyone else.
+    """
+
+    def __init__(self):
+        self._inflight = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._inflight
+
+    async def do(self, key: str, fn):
+        """Awaits `fn()` once per key, sharing its outcome with concurrent callers.
+
+        Args:
+            key (str): The coalescing key (e.g. a normalized company name).
+            fn (callable): A zero-argument coroutine function doing the work.
+
+        Returns:
+            The value returned by `fn()`.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+
+class MongoLease:
+    """A cross-instance scrape lease stored as a document in a Mongo collection.
+
+    Lease documents use `_id = "lease:<key>"`, so acquisition relies on the
+    built-in unique `_id` index: an upsert that only matches an expired lease
+    either takes it over or fails with a duplicate key error while another
+    instance holds it. When the holder finishes it records the stored
+    company name (or the error) so waiting instances can pick up the result.
+
+    Args:
+        collection: The pymongo collection holding the leases.
+        ttl (float): Seconds before an unreleased lease may be taken over.
+        owner (str): Identifier of this instance. Defaults to host name + random id.
+    """
+
+    def __init__(self, collection, ttl: float = 180, owner: str = None):
+        self.collection = collection
+        self.ttl = ttl
+        self.owner = owner or f"{socket.gethostname()}-{uuid.uuid4().hex[:8]}"
+
+    @staticmethod
+    def _id(key: str) -> str:
+        return f"lease:{key}"
+
+    def ensure_indexes(self, retention: int = 300):
+        """Creates a TTL index so finished leases are purged after `retention` seconds."""
+        self.collection.create_index(
+            "lease_expires_at", expireAfterSeconds=retention)
+
+    def acquire(self, key: str) -> bool:
+        """Tries to take the lease for `key`; returns True if this instance holds it."""
+        now = datetime.now(timezone.utc)
+        try:
+            self.collection.find_one_and_update(
+                {"_id": self._id(key), "lease_expires_at": {"$lte": now}},
+                {
+                    "$set": {
+                        "lease_owner": self.owner,
+                        "lease_expires_at": now + timedelta(seconds=self.ttl),
+                    },
+                    "$unset": {"result_company": "", "result_error": ""},
+                },
+                upsert=True,
+            )
+            return True
+        except DuplicateKeyError:
+            return False
+
+    def release(self, key: str, company: str = None, error: str = None):
+        """Releases the lease, recording where the result was stored or why it failed."""
+        update = {"lease_expires_at": datetime.now(timezone.utc)}
+        if company is not None:
+            update["result_company"] = company
+        if error is not None:
+            update["result_error"] = error
+        self.collection.update_one(
+            {"_id": self._id(key), "lease_owner": self.owner}, {"$set": update})
+
+    def status(self, key: str):
+        """Returns the current lease document for `key`, or None."""
+        return self.collection.find_one({"_id": self._id(key)})
@@ -0,0 +1,134 @@
+import glob
+import gzip
+import json
+import os
+import random
+
+
+COMPANIES = ["Paystack", "Flutterwave", "Jumia", "M-Kopa", "Andela", "Chipper Cash",
+             "Wave", "Moniepoint", "Kuda", "Twiga Foods", "Yoco", "Opay"]
+CITIES = ["Lagos, Nigeria", "Nairobi, Kenya", "Cape Town, South Africa", "Accra, Ghana",
+          "Dakar, Senegal", "Kigali, Rwanda", "Cairo, Egypt", "Casablanca, Morocco"]
+WORDS = ("the company was founded by a team of engineers and operates payments lending "
+         "and logistics products for merchants across the continent with offices in several "
+         "markets and investors from europe and the united states").split()
+
+
+def _sentence(rng: random.Random, words: int = 18) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def ddg_page(rng: random.Random, company: str, target: str, scheme: str = "https") -> str:
+    """A DuckDuckGo HTML results page: ~30 results, the `target` host among the first two.
+
+    `target` may carry a port and path prefix (e.g. a local stub standing in for Growjo).
+    """
+    results, position = [], rng.randint(0, 1)
+    for i in range(30):
+        host = target if i == position else rng.choice(
+            ["techcabal.com", "crunchbase.com", "linkedin.com", "bloomberg.com", "reuters.com"])
+        href = f"//duckduckgo.com/l/?uddg={scheme if i == position else 'https'}%3A%2F%2F{host}%2F{company.replace(' ', '_')}%2F{i}&rut=abc{i}"
+        country = rng.choice(CITIES).split(", ")[1]
+        results.append(
+            f'<div class="result results_links results_links_deep web-result">'
+            f'<div class="links_main links_deep result__body"><h2 class="result__title">'
+            f'<a rel="nofollow" class="result__a" href="{href}">{company} – {_sentence(rng, 6)}</a></h2>'
+            f'<div class="result__extras"><div class="result__extras__url">'
+            f'<a class="result__url" href="{href}">{host}/{company.lower()}</a></div></div>'
+            f'<a class="result__snippet" href="{href}">{company} is a {country} company. '
+            f'{_sentence(rng)} It has {rng.randint(5, 60)} investors. {_sentence(rng)}</a>'
+            f'<div class="clear"></div></div></div>')
+    return (f'<!DOCTYPE html><html><head><title>{company} at DuckDuckGo</title>'
+            f'<style>{"a{color:#000}" * 200}</style></head><body><div id="links" class="results">'
+            f'{"".join(results)}</div></body></html>')
+
+
+def wiki_lead(rng: random.Random, company: str) -> str:
+    """A Wikipedia lead section as returned by action=parse&section=0, infobox included."""
+    rows = [
+        ("Company type", "Private"), ("Industry", "Financial technology"),
+        ("Founded", f"{rng.randint(2008, 2020)}; {rng.randint(4, 15)} years ago"),
+        ("Founders", "Jane Doe\nJohn Roe"), ("Headquarters", rng.choice(CITIES)),
+        ("Area served", "Africa"), ("Key people", "Jane Doe (CEO)\nJohn Roe (CTO)"),
+        ("Products", "Payments\nLending\nCards\nPOS terminals"),
+        ("Revenue", f"US${rng.randint(10, 900)} million (2023)[{rng.randint(1, 30)}]"),
+        ("Total assets", f"US${rng.randint(1, 9)}.{rng.randint(0, 9)} billion"),
+        ("Number of employees", f"{rng.randint(100, 3000)} (2024)"),
+        ("Parent", "Stripe"), ("Subsidiaries", "Zap\nTerminal"),
+    ] + [(f"Field {i}", _sentence(rng, 5)) for i in range(20)]
+    infobox = "".join(
+        f'<tr><th scope="row" class="infobox-label">{label}</th>'
+        f'<td class="infobox-data"><a href="/wiki/{label.replace(" ", "_")}" title="{label}">{value}</a><sup class="reference"><a href="#cite_note-{i}">[{i}]</a></sup></td></tr>'
+        for i, (label, value) in enumerate(rows))
+    paragraphs = "".join(
+        f"<p>{' '.join(_sentence(rng) for _ in range(6))}<sup class=\"reference\">[{i}]</sup></p>"
+        for i in range(8))
+    # TemplateStyles and the logo image make up much of a real lead section
+    styles = f'<style data-mw-deduplicate="TemplateStyles:r1">{".mw-parser-output .infobox{border:1px solid #a2a9b1}" * 120}</style>'
+    logo = ('<tr><td colspan="2" class="infobox-image"><span typeof="mw:File"><a href="/wiki/File:Logo.svg" '
+            'class="mw-file-description"><img src="//upload.wikimedia.org/logo.svg.png" decoding="async" '
+            'width="220" height="80" class="mw-file-element" srcset="//upload.wikimedia.org/logo.svg.png 1.5x" />'
+            '</a></span></td></tr>')
+    return (f'<div class="mw-content-ltr mw-parser-output" lang="en" dir="ltr">{styles}'
+            f'<div class="shortdescription">Financial technology company</div>'
+            f'<p class="mw-empty-elt"></p><table class="infobox vcard"><tbody>'
+            f'<tr><th colspan="2" class="infobox-above fn org">{company}</th></tr>{logo}{infobox}'
+            f'<tr><th>Website</th><td><a class="external" href="https://{company.lower()}.com">'
+            f'{company.lower()}.com</a></td></tr></tbody></table>'
+            f'<p><b>{company}</b> is a technology company headquartered in {rng.choice(CITIES)}. '
+            f'{_sentence(rng)}</p>{paragraphs}<meta property="mw:PageProp/toc" /></div>')
+
+
+def growjo_page(rng: random.Random, company: str) -> str:
+    """A Growjo company page with the details list, competitors and funding tables."""
+    details = [
+        f"Estimated Annual Revenue: ${rng.randint(5, 400)}.{rng.randint(0, 9)}M",
+        f"Venture Funding: ${rng.randint(1, 300)}M", f"Revenue per Employee: ${rng.randint(50, 400)}K",
+        f"Total Funding: ${rng.randint(1, 500)}M", f"Current Valuation: ${rng.randint(1, 3)}B",
+        f"Employees: {rng.randint(50, 3000)}", f"Employee Count: {rng.randint(50, 3000)}",
+    ] + [_sentence(rng, 8) for _ in range(20)]
+    competitors = "".join(
+        f"<tr><td>#{i}</td><td>{rng.choice(COMPANIES)}</td><td>${rng.randint(1, 900)}M</td>"
+        f"<td>{rng.randint(10, 5000)}</td><td>{rng.choice(CITIES)}</td></tr>" for i in range(1, 11))
+    funding = "".join(
+        f"<tr><td>{rng.randint(2012, 2024)}-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}</td>"
+        f"<td>${rng.randint(1, 200)}M</td><td>Series {rng.choice('ABCD')}</td>"
+        f"<td>{rng.choice(['Tiger Global', 'Visa', 'Stripe', 'Y Combinator'])}</td></tr>" for _ in range(15))
+    filler = "".join(f'<div class="card"><p>{_sentence(rng, 30)}</p></div>' for _ in range(400))
+    return (f'<!DOCTYPE html><html><head><title>{company} revenue</title>'
+            f'<script>{"var x=1;" * 3000}</script></head><body><nav>{"<a href=/x>Link</a>" * 150}</nav>'
+            f'<main><div class="row"><div class="col-md-5"><ul>'
+            f'{"".join(f"<li>{d}</li>" for d in details)}</ul></div>'
+            f'<div id="revenue-financials"><a href="/industry/Fintech">Fintech</a></div>'
+            f'<table class="cstm-table"><thead><tr><th>Rank</th><th>Competitor Name</th>'
+            f'<th>Revenue</th><th>Employees</th><th>City</th></tr></thead><tbody>{competitors}</tbody></table>'
+            f'<table class="cstm-table"><thead><tr><th>Date</th><th>Amount</th><th>Round</th>'
+            f'<th>Lead Investors</th></tr></thead><tbody>{funding}</tbody></table>'
+            f'{filler}</div></main></body></html>')
+
+
+def synthetic_corpus(seed: int = 7, size: int = 12) -> dict:
+    """Builds a deterministic corpus of pages sized like the real ones."""
+    rng = random.Random(seed)
+    companies = [COMPANIES[i % len(COMPANIES)] for i in range(size)]
+    return {
+        "ddg": [ddg_page(rng, c, rng.choice(["growjo.com", "en.wikipedia.org"])) for c in companies],
+        "wiki": [wiki_lead(rng, c) for c in companies],
+        "growjo": [growjo_page(rng, c) for c in companies],
+    }
+
+
+def load_fixtures(directory: str) -> dict:
+    """Builds a corpus from fixtures recorded with FETCH_MODE=record (see `app.scrapper_functions.fetcher`)."""
+    corpus = {"ddg": [], "wiki": [], "growjo": []}
+    for path in sorted(glob.glob(os.path.join(directory, "**", "*.json.gz"), recursive=True)):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            fixture = json.load(f)
+        url, params = fixture["url"], fixture.get("params") or {}
+        if "duckduckgo.com" in url:
+            corpus["ddg"].append(fixture["text"])
+        elif "growjo.com" in url:
+            corpus["growjo"].append(fixture["text"])
+        elif params.get("action") == "parse":
+            corpus["wiki"].append(json.loads(fixture["text"])["parse"]["text"])
+    return corpus
@@ -0,0 +1,108 @@
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+
+
+# Modules timed by default, from the API entry point down to the scraping stack
+DEFAULT_MODULES = [
+    "app.main",
+    "app.db",
+    "app.cache",
+    "app.company_store",
+    "app.jobs",
+    "app.scrapper_functions.search",
+    "app.scrapper_functions.functions.functions",
+    "app.scrapper_functions.pipeline",
+    "app.scrapper_functions.scrapper",
+]
+
+# Heavy third-party packages that should stay out of the cold-start path
+HEAVY_PACKAGES = ["selenium", "undetected_chromedriver",
+                  "bs4", "polars", "africamonitor", "country_named_entity_recognition"]
+
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(module: str, repeat: int = 3) -> dict:
+    """Imports `module` in fresh interpreters and reports its cumulative import cost.
+
+    Args:
+        module (str): Dotted module name to import.
+        repeat (int): Number of interpreters to run; the fastest run is kept.
+
+    Returns:
+        dict: A dictionary with keys:
+            - "total_ms": float (cumulative import time of `module`)
+            - "heavy": list (heavy packages the import pulled in)
+            - "top": list of (name, ms) for the ten most expensive top-level imports
+    """
+    best = None
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=ROOT, capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+
+        total, loaded, top = 0.0, set(), []
+        for line in proc.stderr.splitlines():
+            match = LINE.match(line)
+            if not match:
+                continue
+            cumulative, indent, name = int(match.group(2)), len(match.group(3)), match.group(4)
+            loaded.add(name.split(".")[0])
+            if indent == 1:
+                top.append((name, cumulative / 1000))
+            if name == module:
+                total = cumulative / 1000
+
+        if best is None or total < best["total_ms"]:
+            best = {
+                "total_ms": round(total, 1),
+                "heavy": [p for p in HEAVY_PACKAGES if p in loaded],
+                "top": sorted(top, key=lambda t: -t[1])[:10],
+            }
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the import-time cost of the app's modules.")
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", help="Write the results to this file")
+    parser.add_argument("--baseline", help="Compare against a previous --json file")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Show the most expensive imports of each module")
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results = {}
+    for module in args.modules:
+        result = results[module] = measure(module, args.repeat)
+        line = f"{module:48} {result['total_ms']:9.1f} ms"
+        if module in baseline:
+            before = baseline[module]["total_ms"]
+            line += f"  (baseline {before:.1f} ms, {result['total_ms'] - before:+.1f})"
+        if result["heavy"]:
+            line += f"  loads: {', '.join(result['heavy'])}"
+        print(line)
+        if args.verbose:
+            for name, ms in result["top"]:
+                print(f"    {name:44} {ms:9.1f} ms")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
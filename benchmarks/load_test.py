@@ -0,0 +1,311 @@
+import argparse
+import itertools
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests  # noqa: E402
+from benchmarks.stubs import StubUpstreams  # noqa: E402
+
+
+SEEDED_COMPANY = "Seeded Company {}"
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def serve(port: int, seed: int):
+    """Runs the app against an in-memory Mongo stand-in, seeded with `seed` fresh companies.
+
+    This is the server half of the harness, started in its own process so its
+    RSS and Chrome children can be measured apart from the load generator.
+    Set MONGO_URI to run against a real MongoDB instead.
+    """
+    import uvicorn
+    from app import db
+
+    if not os.getenv("MONGO_URI"):
+        import mongomock
+
+        database = mongomock.MongoClient()["loadtest"]
+        db.companies._collection = database["companies"]
+        db.countries._collection = database["countries"]
+        db.jobs._collection = database["jobs"]
+
+    from app.company_store import save_company
+    from app.main import app
+
+    for i in range(seed):
+        name = SEEDED_COMPANY.format(i)
+        save_company(db.companies, {
+            "company": name,
+            "company_info_fixed": {"industry": "Financial technology"},
+            "company_info": {"annual revenue": "$12.5M", "employees": "120"},
+            "description": f"{name} is a technology company headquartered in Lagos, Nigeria.",
+            "wiki_page": {"title": name, "pageid": i + 1, "revid": 1},
+            "country": "Nigeria",
+            "competitors": {"competitor name": ["Paystack", "Flutterwave"]},
+            "funding": {"amount": ["$10M"], "round": ["Series A"]},
+        })
+
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def process_tree(pid: int) -> list:
+    """Returns `pid` and all of its descendants, read from /proc."""
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # The command name may contain spaces and parentheses; ppid follows the last ")"
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(entry))
+
+    tree, stack = [], [pid]
+    while stack:
+        current = stack.pop()
+        tree.append(current)
+        stack.extend(children.get(current, []))
+    return tree
+
+
+def sample_processes(pid: int) -> dict:
+    """Counts the Chrome processes under `pid` and sums the RSS of the whole tree.
+
+    Returns:
+        dict: A dictionary with keys:
+            - "chrome": int (chrome, chromedriver and renderer processes)
+            - "rss_bytes": int (summed over the tree, so shared pages count more than once)
+            - "server_rss_bytes": int (the app process alone)
+    """
+    sample = {"chrome": 0, "rss_bytes": 0, "server_rss_bytes": 0}
+    for current in process_tree(pid):
+        name, rss = "", 0
+        try:
+            with open(f"/proc/{current}/status") as f:
+                for line in f:
+                    if line.startswith("Name:"):
+                        name = line.split(None, 1)[1].strip()
+                    elif line.startswith("VmRSS:"):
+                        rss = int(line.split()[1]) * 1024
+        except OSError:
+            continue
+        if "chrom" in name.lower():
+            sample["chrome"] += 1
+        sample["rss_bytes"] += rss
+        if current == pid:
+            sample["server_rss_bytes"] = rss
+    return sample
+
+
+class Sampler(threading.Thread):
+    """Samples the server's process tree every `interval` seconds until stopped."""
+
+    def __init__(self, pid: int, interval: float = 0.5):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.interval = interval
+        self.samples = []
+        self._done = threading.Event()
+
+    def run(self):
+        while not self._done.is_set():
+            self.samples.append(sample_processes(self.pid))
+            self._done.wait(self.interval)
+
+    def stop(self) -> list:
+        self._done.set()
+        self.join()
+        self.samples.append(sample_processes(self.pid))
+        return self.samples
+
+
+def percentile(values: list, q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, max(0, round(q / 100 * len(values)) - 1))]
+
+
+def run_level(base_url: str, concurrency: int, duration: float, hit_ratio: float,
+              seeded: int, wait: bool, timeout: float, misses) -> list:
+    """Drives `/information/{company}` from `concurrency` clients for `duration` seconds.
+
+    Each request is a hit on a seeded company with probability `hit_ratio`,
+    otherwise a lookup of a company never seen before.
+
+    Returns:
+        list: One `(kind, status, seconds)` tuple per request.
+    """
+    results, lock = [], threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def client(worker: int):
+        rng = random.Random(worker)
+        session = requests.Session()
+        while time.monotonic() < deadline:
+            if seeded and rng.random() < hit_ratio:
+                kind, company = "hit", SEEDED_COMPANY.format(rng.randrange(seeded))
+            else:
+                kind, company = "miss", f"Loadtest Company {next(misses)}"
+            start = time.perf_counter()
+            try:
+                response = session.get(f"{base_url}/information/{company}",
+                                       params={"wait": "true"} if wait else None, timeout=timeout)
+                status = response.status_code
+            except requests.RequestException:
+                status = 0
+            with lock:
+                results.append((kind, status, time.perf_counter() - start))
+        session.close()
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def summarize(concurrency: int, duration: float, results: list, samples: list) -> dict:
+    latencies = sorted(seconds for _, _, seconds in results)
+    statuses = {}
+    for _, status, _ in results:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+
+    summary = {
+        "concurrency": concurrency,
+        "requests": len(results),
+        "throughput": round(len(results) / duration, 1),
+        "errors": sum(1 for _, status, _ in results if status == 0 or status >= 500),
+        "statuses": statuses,
+        "chrome_max": max(s["chrome"] for s in samples),
+        "rss_max_mib": round(max(s["rss_bytes"] for s in samples) / 2 ** 20, 1),
+        "server_rss_max_mib": round(max(s["server_rss_bytes"] for s in samples) / 2 ** 20, 1),
+    }
+    for q in (50, 90, 99):
+        summary[f"p{q}_ms"] = round(percentile(latencies, q) * 1000, 1)
+    summary["max_ms"] = round(latencies[-1] * 1000, 1) if latencies else 0.0
+    for kind in ("hit", "miss"):
+        kind_latencies = sorted(seconds for k, _, seconds in results if k == kind)
+        summary[f"{kind}_requests"] = len(kind_latencies)
+        summary[f"{kind}_p50_ms"] = round(percentile(kind_latencies, 50) * 1000, 1)
+        summary[f"{kind}_p99_ms"] = round(percentile(kind_latencies, 99) * 1000, 1)
+    return summary
+
+
+def wait_until_ready(base_url: str, server: subprocess.Popen, timeout: float = 60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise Exception(f"The app exited during startup (code {server.returncode})")
+        try:
+            if requests.get(base_url + "/", timeout=1).status_code == 200:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    raise Exception(f"The app did not start within {timeout}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Load-test /information/{company} against local stub upstreams.")
+    parser.add_argument("--concurrency", default="1,2,4,8,16",
+                        help="Comma-separated client counts, run in turn")
+    parser.add_argument("--duration", type=float, default=20, help="Seconds per concurrency level")
+    parser.add_argument("--hit-ratio", type=float, default=0.8,
+                        help="Share of requests for companies already stored")
+    parser.add_argument("--seed", type=int, default=200, help="Companies stored before the run")
+    parser.add_argument("--no-wait", dest="wait", action="store_false",
+                        help="Let misses return 202 with a job instead of waiting for the scrape")
+    parser.add_argument("--timeout", type=float, default=120, help="Client timeout per request")
+    parser.add_argument("--ddg-latency", type=float, default=300, help="Mean DuckDuckGo delay in ms")
+    parser.add_argument("--wiki-latency", type=float, default=150, help="Mean Wikipedia API delay in ms")
+    parser.add_argument("--growjo-latency", type=float, default=800, help="Mean Growjo delay in ms")
+    parser.add_argument("--jitter", type=float, default=0.5, help="Relative spread of the delays")
+    parser.add_argument("--save", help="Write the results to this JSON file")
+    parser.add_argument("--server-log", help="File for the app's output (default: a temporary file)")
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.port, args.seed)
+        return
+
+    stubs = StubUpstreams(args.ddg_latency / 1000, args.wiki_latency / 1000,
+                          args.growjo_latency / 1000, args.jitter).start()
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    env = {
+        **os.environ,
+        **stubs.env(),
+        "FETCH_MODE": "live",
+        "LOG_LEVEL": os.getenv("LOG_LEVEL", "WARNING"),
+    }
+    server_log = args.server_log or tempfile.mkstemp(prefix="load_test_", suffix=".log")[1]
+    print(f"stubs: {', '.join(f'{k}={v}' for k, v in stubs.env().items())}; server log: {server_log}")
+
+    with open(server_log, "w") as log:
+        server = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), "--serve",
+             "--port", str(port), "--seed", str(args.seed)],
+            env=env, stdout=log, stderr=subprocess.STDOUT)
+    try:
+        wait_until_ready(base_url, server)
+        baseline = sample_processes(server.pid)
+        print(f"app ready: {baseline['chrome']} chrome processes, "
+              f"{baseline['rss_bytes'] / 2 ** 20:.1f} MiB RSS")
+
+        misses = itertools.count()
+        summaries = []
+        print(f"{'clients':>7} {'reqs':>6} {'req/s':>7} {'errors':>6} {'p50 ms':>8} {'p90 ms':>8} "
+              f"{'p99 ms':>8} {'hit p50':>8} {'miss p50':>9} {'chrome':>6} {'RSS MiB':>8}")
+        for concurrency in (int(c) for c in args.concurrency.split(",")):
+            sampler = Sampler(server.pid)
+            sampler.start()
+            results = run_level(base_url, concurrency, args.duration, args.hit_ratio,
+                                args.seed, args.wait, args.timeout, misses)
+            summary = summarize(concurrency, args.duration, results, sampler.stop())
+            summaries.append(summary)
+            print(f"{concurrency:7d} {summary['requests']:6d} {summary['throughput']:7.1f} "
+                  f"{summary['errors']:6d} {summary['p50_ms']:8.1f} {summary['p90_ms']:8.1f} "
+                  f"{summary['p99_ms']:8.1f} {summary['hit_p50_ms']:8.1f} {summary['miss_p50_ms']:9.1f} "
+                  f"{summary['chrome_max']:6d} {summary['rss_max_mib']:8.1f}")
+            if server.poll() is not None:
+                print(f"The app exited (code {server.returncode}); see {server_log}")
+                break
+
+        print(f"upstream requests: {stubs.requests()}")
+        if args.save:
+            with open(args.save, "w") as f:
+                json.dump({"settings": vars(args), "levels": summaries,
+                           "upstream_requests": stubs.requests()}, f, indent=2)
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            server.kill()
+        stubs.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup  # noqa: E402
+from app.scrapper_functions.data.data import african_countries  # noqa: E402
+from app.scrapper_functions.functions.functions import (  # noqa: E402
+    extract_link, extract_most_mentioned_country, extract_company_details,
+    extract_table_data, parse_wiki_lead)
+from benchmarks.corpus import synthetic_corpus, load_fixtures  # noqa: E402
+
+
+def prepare(corpus: dict) -> dict:
+    """Turns raw pages into the inputs each parser receives in the pipeline.
+
+    Returns:
+        dict: Maps benchmark names to `(fn, inputs)`; each input is a tuple of arguments.
+    """
+    ddg = [BeautifulSoup(html, "html.parser") for html in corpus["ddg"]]
+    growjo = [BeautifulSoup(html, "html.parser") for html in corpus["growjo"]]
+
+    links = []
+    for soup in ddg:
+        results = soup.find("div", class_="results")
+        hrefs = " ".join(a.get("href", "") for a in results.find_all("a", class_="result__url")[:2])
+        link_type = "growjo.com" if "growjo.com" in hrefs else "en.wikipedia.org"
+        links.append((results, link_type))
+
+    texts = [(" ".join({el.text.strip().lower() for el in soup.find_all("div", class_="result")}),
+              african_countries) for soup in ddg]
+
+    details, tables = [], []
+    for soup in growjo:
+        info_div = soup.find("div", class_="col-md-5")
+        details.append(([li.text.strip() for li in info_div.find_all("li")],))
+        tables.extend((table,) for table in soup.find_all("table", class_="cstm-table"))
+
+    return {
+        "extract_link": (extract_link, links),
+        "extract_most_mentioned_country": (extract_most_mentioned_country, texts),
+        "extract_company_details": (extract_company_details, details),
+        "extract_table_data": (extract_table_data, tables),
+        "parse_wiki_lead": (parse_wiki_lead, [(html,) for html in corpus["wiki"]]),
+    }
+
+
+def measure(fn, inputs: list, min_time: float) -> dict:
+    """Times `fn` over every input until `min_time` has passed, then traces one pass.
+
+    Returns:
+        dict: A dictionary with keys:
+            - "ops_per_sec": float (calls per second, one call per input)
+            - "us_per_op": float
+            - "peak_kib": float (largest transient allocation of a single call)
+            - "retained_kib": float (memory still held after a call, on average)
+    """
+    for args in inputs:  # warm-up, also fills regex and matcher caches
+        fn(*args)
+
+    ops, start = 0, time.perf_counter()
+    while True:
+        for args in inputs:
+            fn(*args)
+        ops += len(inputs)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+
+    peak = retained = 0
+    tracemalloc.start()
+    for args in inputs:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        result = fn(*args)
+        current, top = tracemalloc.get_traced_memory()
+        peak = max(peak, top - before)
+        retained += current - before
+        del result
+    tracemalloc.stop()
+
+    return {
+        "ops_per_sec": round(ops / elapsed, 1),
+        "us_per_op": round(elapsed / ops * 1e6, 2),
+        "peak_kib": round(peak / 1024, 1),
+        "retained_kib": round(retained / len(inputs) / 1024, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the scrape parsers.")
+    parser.add_argument("names", nargs="*", help="Benchmarks to run (default: all)")
+    parser.add_argument("--corpus", help="Fixture directory recorded with FETCH_MODE=record "
+                                         "(default: a generated corpus of realistic pages)")
+    parser.add_argument("--min-time", type=float, default=1.0)
+    parser.add_argument("--save", help="Write the results to this JSON file")
+    parser.add_argument("--baseline", help="Compare against a JSON file written with --save "
+                                           "on the same machine")
+    parser.add_argument("--threshold", type=float, default=10,
+                        help="Percent slowdown reported as a regression")
+    args = parser.parse_args()
+
+    corpus = synthetic_corpus()
+    if args.corpus:
+        recorded = load_fixtures(args.corpus)
+        corpus.update({kind: pages for kind, pages in recorded.items() if pages})
+    print("corpus: " + ", ".join(
+        f"{kind} {len(pages)} pages, {sum(map(len, pages)) // len(pages) // 1024} KiB avg"
+        for kind, pages in corpus.items()))
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    benchmarks = prepare(corpus)
+    results, regressions = {}, []
+    print(f"{'benchmark':32} {'ops/sec':>12} {'us/op':>10} {'peak KiB':>9} {'kept KiB':>9}")
+    for name, (fn, inputs) in benchmarks.items():
+        if args.names and name not in args.names:
+            continue
+        result = results[name] = measure(fn, inputs, args.min_time)
+        line = (f"{name:32} {result['ops_per_sec']:12.1f} {result['us_per_op']:10.2f} "
+                f"{result['peak_kib']:9.1f} {result['retained_kib']:9.2f}")
+        if name in baseline:
+            change = (result["ops_per_sec"] / baseline[name]["ops_per_sec"] - 1) * 100
+            line += f"  {change:+6.1f}% vs baseline"
+            if change < -args.threshold:
+                line += "  REGRESSION"
+                regressions.append(name)
+        print(line)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+import argparse
+import cProfile
+import os
+import pstats
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.scrapper_functions.fetcher import RecordingFetcher, ReplayFetcher, set_fetcher  # noqa: E402
+from app.scrapper_functions.search import search_cache  # noqa: E402
+from app.scrapper_functions.ner import find_country_codes  # noqa: E402
+from app.scrapper_functions.pipeline import run_company_pipeline  # noqa: E402
+
+
+def run(companies: list, pool, repeat: int) -> dict:
+    """Runs the pipeline for every company `repeat` times with cold caches.
+
+    Returns:
+        dict: Maps each company to its list of run durations in seconds.
+    """
+    timings = {company: [] for company in companies}
+    for _ in range(repeat):
+        for company in companies:
+            search_cache.clear()
+            find_country_codes.cache_clear()
+            start = time.perf_counter()
+            result = run_company_pipeline(company, pool)
+            timings[company].append(time.perf_counter() - start)
+            if result["errors"]:
+                print(f"  {company}: errors in {', '.join(result['errors'])}")
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Record scrape fixtures, or replay them to time and profile the pipeline offline.")
+    parser.add_argument("companies", nargs="+")
+    parser.add_argument("--mode", choices=("record", "replay"), default="replay")
+    parser.add_argument("--fixtures", default="fixtures")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--profile", action="store_true",
+                        help="Print the top functions by cumulative time")
+    args = parser.parse_args()
+
+    if args.mode == "record":
+        # Recording drives real Chrome drivers for the browser-only pages
+        from app.scrapper_functions.scrapper import driver_pool as pool
+        set_fetcher(RecordingFetcher(args.fixtures))
+        repeat = 1
+    else:
+        # Replayed pages never reach a driver, so no pool is needed
+        pool = None
+        set_fetcher(ReplayFetcher(args.fixtures))
+        repeat = args.repeat
+
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler:
+        profiler.enable()
+    timings = run(args.companies, pool, repeat)
+    if profiler:
+        profiler.disable()
+
+    for company, runs in timings.items():
+        runs.sort()
+        print(f"{company:32} best {runs[0] * 1000:8.1f} ms  median {runs[len(runs) // 2] * 1000:8.1f} ms")
+
+    if profiler:
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+
+    if args.mode == "record":
+        pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+from collections import Counter
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+import json
+import random
+import threading
+import time
+import zlib
+
+from benchmarks.corpus import ddg_page, wiki_lead, growjo_page
+
+
+# What `functions.url` wraps around a company name, stripped to recover it
+QUERY_PREFIXES = ("how many investors does ",)
+QUERY_SUFFIXES = (" have?", " growjo.com company", " crunchbase.com company",
+                  " company wikipedia", " company founded in what country?", " company")
+
+
+def company_from_query(query: str) -> str:
+    """Recovers the company name from a search query built by `functions.url`."""
+    for prefix in QUERY_PREFIXES:
+        if query.startswith(prefix):
+            query = query[len(prefix):]
+    for suffix in QUERY_SUFFIXES:
+        if query.endswith(suffix):
+            return query[:-len(suffix)]
+    return query
+
+
+def _rng(*parts) -> random.Random:
+    # Pages are derived from the company name, so repeat requests see the same page
+    return random.Random(zlib.crc32(" ".join(map(str, parts)).encode("utf-8")))
+
+
+def page_id(title: str) -> int:
+    return zlib.crc32(title.encode("utf-8")) % 10 ** 8
+
+
+class StubServer:
+    """A local HTTP server answering GETs with `respond(path, params)` after a delay.
+
+    Args:
+        respond (callable): Returns `(status, content_type, body)` for a path and
+            its query parameters (first value of each).
+        latency (float): Mean delay in seconds before every response.
+        jitter (float): Relative spread of the delay; 0.5 means ±50%.
+    """
+
+    def __init__(self, respond, latency: float = 0.0, jitter: float = 0.5):
+        self.respond = respond
+        self.latency = latency
+        self.jitter = jitter
+        self.requests = Counter()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def address(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    def _delay(self) -> float:
+        spread = self.latency * self.jitter
+        return max(0.0, random.uniform(self.latency - spread, self.latency + spread))
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                params = {k: v[0] for k, v in parse_qs(url.query).items()}
+                try:
+                    status, content_type, body = stub.respond(url.path, params)
+                except Exception as e:
+                    status, content_type, body = 500, "text/plain", str(e)
+                with stub._lock:
+                    stub.requests[status] += 1
+                time.sleep(stub._delay())
+
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class StubUpstreams:
+    """Local stand-ins for DuckDuckGo HTML search, the Wikipedia API and Growjo.
+
+    Pages come from the `benchmarks.corpus` generators and are derived from the
+    company in the request, so any company name resolves. DuckDuckGo results
+    for Growjo queries link to the Growjo stub, so the Chrome drivers load it.
+
+    Args:
+        ddg_latency (float): Mean DuckDuckGo response delay in seconds.
+        wiki_latency (float): Mean Wikipedia API response delay in seconds.
+        growjo_latency (float): Mean Growjo response delay in seconds.
+        jitter (float): Relative spread of every delay.
+    """
+
+    def __init__(self, ddg_latency: float = 0.3, wiki_latency: float = 0.15,
+                 growjo_latency: float = 0.8, jitter: float = 0.5):
+        self.ddg = StubServer(self._ddg, ddg_latency, jitter)
+        self.wiki = StubServer(self._wiki, wiki_latency, jitter)
+        self.growjo = StubServer(self._growjo, growjo_latency, jitter)
+
+    def start(self):
+        for server in (self.ddg, self.wiki, self.growjo):
+            server.start()
+        return self
+
+    def close(self):
+        for server in (self.ddg, self.wiki, self.growjo):
+            server.close()
+
+    def env(self) -> dict:
+        """The environment that points the app's scrapers at the stubs."""
+        return {
+            "DDG_HTML_URL": f"http://{self.ddg.address}/html/?q=",
+            "WIKIPEDIA_API_URL": f"http://{self.wiki.address}/w/api.php",
+        }
+
+    def requests(self) -> dict:
+        """Requests served so far by each stub, by status code."""
+        return {name: dict(server.requests) for name, server in
+                (("ddg", self.ddg), ("wiki", self.wiki), ("growjo", self.growjo))}
+
+    def _ddg(self, path: str, params: dict) -> tuple:
+        query = params.get("q", "")
+        return 200, "text/html; charset=utf-8", self._ddg_page(query)
+
+    @lru_cache(maxsize=1024)
+    def _ddg_page(self, query: str) -> str:
+        company = company_from_query(query)
+        if "growjo.com" in query:
+            return ddg_page(_rng("ddg", query), company, f"{self.growjo.address}/growjo.com", "http")
+        return ddg_page(_rng("ddg", query), company, "en.wikipedia.org")
+
+    def _wiki(self, path: str, params: dict) -> tuple:
+        action = params.get("action")
+        if action == "opensearch":
+            search = params.get("search", "")
+            data = [search, [search], [""], [""]]
+        elif action == "parse":
+            title = params.get("page", "")
+            data = {"parse": {"title": title, "pageid": page_id(title), "revid": 1,
+                              "text": self._wiki_lead(title)}}
+        elif action == "query" and params.get("list") == "search":
+            title = company_from_query(params.get("srsearch", ""))
+            data = {"query": {"search": [{"ns": 0, "title": title}]}}
+        elif action == "query" and "pageids" in params:
+            data = {"query": {"pages": [
+                {"pageid": int(pageid), "lastrevid": 1}
+                for pageid in params["pageids"].split("|")]}}
+        else:
+            data = {"error": {"code": "badvalue", "info": f"Unsupported action '{action}'"}}
+        return 200, "application/json; charset=utf-8", json.dumps(data)
+
+    @lru_cache(maxsize=1024)
+    def _wiki_lead(self, title: str) -> str:
+        return wiki_lead(_rng("wiki", title), title)
+
+    def _growjo(self, path: str, params: dict) -> tuple:
+        if not path.startswith("/growjo.com/"):
+            return 404, "text/html", "<html><body>Not found</body></html>"
+        company = unquote(path.split("/")[2]).replace("_", " ")
+        return 200, "text/html; charset=utf-8", self._growjo_page(company)
+
+    @lru_cache(maxsize=1024)
+    def _growjo_page(self, company: str) -> str:
+        return growjo_page(_rng("growjo", company), company)